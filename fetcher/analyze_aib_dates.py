@@ -1,11 +1,21 @@
 """Analyze statement dates and generate summary report."""
 
-import hashlib
+import mmap
+import os
 import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
+import numpy as np
+from blake3 import blake3
+
+from cache import load_cache, save_cache
 from models import (
     StatementInfo,
     StatementBreak,
@@ -20,58 +30,187 @@ import parsers.aib_debit  # noqa: F401
 import parsers.aib_credit  # noqa: F401
 import parsers.revolut_debit  # noqa: F401
 
+# Persistent cache of parse results keyed by file signature; bump the version
+# whenever a parser change could alter previously cached results
+PARSE_CACHE_NAME = "statement_dates"
+PARSE_CACHE_VERSION = 4
+
+# Month abbreviations as they appear in statement dates ("5 Mar 2018")
+_MONTHS = {
+    "Jan": 1,
+    "Feb": 2,
+    "Mar": 3,
+    "Apr": 4,
+    "May": 5,
+    "Jun": 6,
+    "Jul": 7,
+    "Aug": 8,
+    "Sep": 9,
+    "Oct": 10,
+    "Nov": 11,
+    "Dec": 12,
+}
+
 
 def compute_file_signature(pdf_path: Path) -> str:
     """
-    Compute SHA256 hash of file content to identify duplicates.
+    Compute BLAKE3 hash of file content to identify duplicates.
 
     Args:
         pdf_path: Path to the PDF file
 
     Returns:
-        Hex string of the file's SHA256 hash
+        Hex string of the file's BLAKE3 hash
     """
-    sha256_hash = hashlib.sha256()
+    file_hash = blake3()
     with open(pdf_path, "rb") as f:
-        for byte_block in iter(lambda: f.read(4096), b""):
-            sha256_hash.update(byte_block)
-    return sha256_hash.hexdigest()
+        # Empty files cannot be memory-mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            return file_hash.hexdigest()
+
+        # Hash the mapped file in one call instead of copying it through
+        # Python in small chunks
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            file_hash.update(mapped)
+    return file_hash.hexdigest()
 
 
+@lru_cache(maxsize=4096)
 def parse_date(date_str: str) -> datetime:
-    """Parse date string in format 'DD MMM YYYY' to datetime."""
-    return datetime.strptime(date_str, "%d %b %Y")
+    """
+    Parse date string in format 'DD MMM YYYY' to datetime.
+
+    Builds the datetime directly instead of going through strptime, and
+    caches results since statement boundary dates repeat across statements.
+
+    Raises:
+        ValueError: If the string is not a valid 'DD MMM YYYY' date.
+    """
+    day, month, year = date_str.split()
+    month_number = _MONTHS.get(month.capitalize())
+    if month_number is None or len(year) != 4:
+        raise ValueError(f"Invalid date: {date_str!r}")
+    return datetime(int(year), month_number, int(day))
 
 
-def analyze_statements(statements_dir: Path) -> Optional[StatementsAnalysis]:
+def _parse_statement_file(pdf_path: Path) -> tuple[str, str, str] | None:
+    """
+    Parse a single statement PDF.
+
+    Worker processes call this module-level wrapper so that importing this
+    module registers the parsers, whichever start method the pool uses.
+    """
+    return parse_statement(pdf_path)
+
+
+def _prefetch_file(pdf_path: Path) -> None:
+    """Pull a file into the OS page cache ahead of use; failures are ignored."""
+    try:
+        with open(pdf_path, "rb") as f:
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+            else:
+                while f.read(1 << 20):
+                    pass
+    except OSError:
+        pass
+
+
+def _map_files(func, pdf_paths: list[Path], executor) -> list:
+    """Apply func to each path, using the executor when one is given."""
+    # With several files, hint them all up front so the kernel can queue
+    # every read at once instead of one file at a time
+    hint_all = hasattr(os, "posix_fadvise") and len(pdf_paths) >= 4
+    if hint_all:
+        for pdf_path in pdf_paths:
+            _prefetch_file(pdf_path)
+
+    if executor is not None:
+        return list(executor.map(func, pdf_paths, chunksize=4))
+    if hint_all or len(pdf_paths) < 2:
+        return [func(pdf_path) for pdf_path in pdf_paths]
+
+    # Serially, read the next file from disk while func works on the current one
+    results = []
+    with ThreadPoolExecutor(max_workers=1) as prefetcher:
+        for index, pdf_path in enumerate(pdf_paths):
+            if index + 1 < len(pdf_paths):
+                prefetcher.submit(_prefetch_file, pdf_paths[index + 1])
+            results.append(func(pdf_path))
+    return results
+
+
+def analyze_statements(
+    statements_dir: Path, max_workers: int = 1, use_cache: bool = False
+) -> Optional[StatementsAnalysis]:
     """
     Analyze all statement PDFs in a directory using auto-detection.
 
     Args:
         statements_dir: Path to directory containing statement PDFs
+        max_workers: Number of worker processes used to hash and parse PDFs
+            (1 processes files in the current process)
+        use_cache: Reuse parse results from previous runs for files whose
+            signature is already in the on-disk cache
 
     Returns:
         StatementsAnalysis object with complete analysis, or None if directory not found
     """
-    if not statements_dir.exists():
+    if not statements_dir.is_dir():
         print(f"Directory not found: {statements_dir}")
         return None
 
-    # Collect all statement information
     statements = []
-    signature_map = {}
+    valid_statements = []
+    signature_map = defaultdict(list)
 
-    pdf_files = []
-    for pdf_path in statements_dir.glob("*.pdf"):
-        mod_time = pdf_path.stat().st_mtime
-        pdf_files.append((pdf_path, mod_time))
+    # DirEntry caches file type (and on Windows, stat data) from the listing
+    with os.scandir(statements_dir) as entries:
+        pdf_files = [
+            (Path(entry.path), entry.stat().st_mtime)
+            for entry in entries
+            if entry.name.endswith(".pdf") and entry.is_file()
+        ]
 
     pdf_files.sort(key=lambda x: x[1])
 
-    for pdf_path, mod_time in pdf_files:
-        result = parse_statement(pdf_path)
+    # Hashing and parsing are CPU-bound and independent per file
+    pdf_paths = [pdf_path for pdf_path, _ in pdf_files]
+    use_pool = max_workers > 1 and len(pdf_paths) > 1
+    with (
+        ProcessPoolExecutor(max_workers=max_workers) if use_pool else nullcontext()
+    ) as executor:
+        signatures = _map_files(compute_file_signature, pdf_paths, executor)
+
+        # Parse each distinct file content only once (re-downloaded copies of
+        # the same statement share a signature), skipping content already
+        # parsed by a previous run
+        cached_results = (
+            load_cache(PARSE_CACHE_NAME, PARSE_CACHE_VERSION) if use_cache else {}
+        )
+        first_path_by_signature = {}
+        for pdf_path, signature in zip(pdf_paths, signatures):
+            if signature not in cached_results:
+                first_path_by_signature.setdefault(signature, pdf_path)
+        unique_paths = list(first_path_by_signature.values())
+        parse_results = _map_files(_parse_statement_file, unique_paths, executor)
+        parse_cache = dict(zip(first_path_by_signature, parse_results))
+
+    if use_cache:
+        # Failed parses are not cached so that newly added parsers get a chance
+        new_results = {
+            signature: result for signature, result in parse_cache.items() if result
+        }
+        if new_results:
+            cached_results.update(new_results)
+            save_cache(PARSE_CACHE_NAME, PARSE_CACHE_VERSION, cached_results)
+        parse_cache = {**cached_results, **parse_cache}
+
+    for (pdf_path, mod_time), signature in zip(pdf_files, signatures):
+        result = parse_cache[signature]
         mod_datetime = datetime.fromtimestamp(mod_time)
-        signature = compute_file_signature(pdf_path)
 
         if result:
             start_date, end_date, parser_name = result
@@ -92,9 +231,8 @@ def analyze_statements(statements_dir: Path) -> Optional[StatementsAnalysis]:
             )
 
             statements.append(statement_info)
+            valid_statements.append(statement_info)
 
-            if signature not in signature_map:
-                signature_map[signature] = []
             signature_map[signature].append(pdf_path.name)
         else:
             statement_info = StatementInfo(
@@ -123,9 +261,6 @@ def analyze_statements(statements_dir: Path) -> Optional[StatementsAnalysis]:
             ),
         )
 
-    # Sort statements by start date for analysis (only valid ones)
-    valid_statements = [s for s in statements if s.error is None]
-
     if not valid_statements:
         return StatementsAnalysis(
             statements=statements,
@@ -137,7 +272,8 @@ def analyze_statements(statements_dir: Path) -> Optional[StatementsAnalysis]:
             ),
         )
 
-    statements_by_date = sorted(valid_statements, key=lambda s: s.start_date_parsed)
+    # Sort statements by start date for analysis (only valid ones)
+    statements_by_date = sorted(valid_statements, key=attrgetter("start_date_parsed"))
 
     # Find duplicates (signatures with multiple files)
     duplicates = []
@@ -145,25 +281,30 @@ def analyze_statements(statements_dir: Path) -> Optional[StatementsAnalysis]:
         if len(files) > 1:
             duplicates.append(DuplicateGroup(signature=signature, files=files))
 
-    # Find breaks in statement continuity
+    # Find breaks in statement continuity: gaps between consecutive
+    # statements are computed in one vectorized subtraction
+    starts = np.array(
+        [s.start_date_parsed for s in statements_by_date], dtype="datetime64[D]"
+    )
+    ends = np.array(
+        [s.end_date_parsed for s in statements_by_date], dtype="datetime64[D]"
+    )
+    gaps = (starts[1:] - ends[:-1]).astype(int)
+
+    # A break is when the gap is more than 1 day
     breaks = []
-    for i in range(len(statements_by_date) - 1):
+    for i in np.flatnonzero(gaps > 1):
         current = statements_by_date[i]
         next_stmt = statements_by_date[i + 1]
-
-        gap_days = (next_stmt.start_date_parsed - current.end_date_parsed).days
-
-        # A break is when the gap is more than 1 day
-        if gap_days > 1:
-            breaks.append(
-                StatementBreak(
-                    previous_file=current.file_name,
-                    previous_end_date=current.end_date,
-                    next_file=next_stmt.file_name,
-                    next_start_date=next_stmt.start_date,
-                    gap_days=gap_days,
-                )
+        breaks.append(
+            StatementBreak(
+                previous_file=current.file_name,
+                previous_end_date=current.end_date,
+                next_file=next_stmt.file_name,
+                next_start_date=next_stmt.start_date,
+                gap_days=int(gaps[i]),
             )
+        )
 
     # Calculate continuous period
     first_stmt = statements_by_date[0]
@@ -189,7 +330,9 @@ def main():
     else:
         statements_dir = Path("../statements_raw/aib/debit")
 
-    analysis = analyze_statements(statements_dir)
+    analysis = analyze_statements(
+        statements_dir, max_workers=os.cpu_count() or 1, use_cache=True
+    )
 
     if not analysis:
         return
@@ -245,7 +388,7 @@ def main():
     print("-" * 100)
 
     for stmt in analysis.statements:
-        mod_str = stmt.modified_timestamp.strftime("%Y-%m-%d %H:%M:%S")
+        mod_str = stmt.modified_str
         parser_name = stmt.parser_name or "N/A"
         if stmt.error:
             print(
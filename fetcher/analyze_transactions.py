@@ -5,30 +5,73 @@ Supports:
 - Revolut Excel (.xlsx) exports
 """
 
+import hashlib
+import math
+import os
 import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from itertools import chain, repeat
 from pathlib import Path
-from collections import defaultdict
-from datetime import datetime
+from operator import attrgetter
 
-from parsers import parse_statement
-from parsers.aib_debit import AIBDebitParser
-from parsers.aib_credit import AIBCreditParser
-from parsers.revolut_excel_transaction_extractor import RevolutExcelTransactionExtractor
+import numpy as np
+
+from cache import load_cache, save_cache
+from parsers.batch import parse_pdf
+
+# Importing the parser modules registers them for auto-detection
+import parsers.aib_debit  # noqa: F401
+import parsers.aib_credit  # noqa: F401
 from models import Transaction
 
-# Import parsers to trigger registration
-_ = AIBDebitParser()
-_ = AIBCreditParser()
+# Persistent cache of extracted transactions per file; bump the version
+# whenever a parser change could alter previously extracted transactions
+TRANSACTIONS_CACHE_NAME = "transactions"
+TRANSACTIONS_CACHE_VERSION = 5
+
+# Bytes from the start of a file hashed into its cache fingerprint
+FINGERPRINT_HEAD_BYTES = 64 * 1024
+
 
+def _file_fingerprint(file_path: Path) -> tuple:
+    """Cheap content identity of a file: mtime, size and a hash of its first bytes."""
+    stat = file_path.stat()
+    with open(file_path, "rb") as f:
+        head_hash = hashlib.blake2b(
+            f.read(FINGERPRINT_HEAD_BYTES), digest_size=8
+        ).hexdigest()
+    return (stat.st_mtime_ns, stat.st_size, head_hash)
 
-def parse_date(date_str: str) -> datetime:
-    """Parse date string in 'DD MMM YYYY' format to datetime."""
-    return datetime.strptime(date_str, "%d %b %Y")
+
+def list_statement_files(statements_dir: Path) -> tuple[list[Path], list[Path]]:
+    """
+    List statement files in a directory, partitioned in a single scan.
+
+    Returns:
+        Tuple of (PDF files, Excel files), each sorted by path
+    """
+    pdf_files = []
+    excel_files = []
+    with os.scandir(statements_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".pdf") and entry.is_file():
+                pdf_files.append(Path(entry.path))
+            elif entry.name.endswith(".xlsx") and entry.is_file():
+                excel_files.append(Path(entry.path))
+    pdf_files.sort()
+    excel_files.sort()
+    return pdf_files, excel_files
 
 
 def analyze_transactions_directory(
     statements_dir: Path,
     revolut_product: str = "Current",
+    max_workers: int = 1,
+    use_cache: bool = False,
+    pdf_files: list[Path] | None = None,
+    excel_files: list[Path] | None = None,
 ) -> dict[str, list[Transaction]]:
     """
     Analyze transactions from all statements (PDF and Excel) in a directory.
@@ -36,48 +79,92 @@ def analyze_transactions_directory(
     Args:
         statements_dir: Directory containing statement files
         revolut_product: Product filter for Revolut Excel files (default: "Current")
+        max_workers: Number of worker processes used to extract transactions
+            (1 processes files in the current process)
+        use_cache: Reuse transactions extracted by previous runs for files
+            whose fingerprint (mtime, size, leading bytes) is unchanged
+        pdf_files: PDF files to process, as listed by list_statement_files
+            (the directory is scanned if either file list is omitted)
+        excel_files: Excel files to process, as listed by list_statement_files
 
     Returns:
         Dictionary mapping file paths to lists of Transaction objects
     """
-    results = {}
+    if pdf_files is None or excel_files is None:
+        pdf_files, excel_files = list_statement_files(statements_dir)
+
+    # Excel results depend on the product filter, PDF results do not
+    cache_keys = {pdf_path: (str(pdf_path.resolve()), None) for pdf_path in pdf_files}
+    cache_keys.update(
+        (excel_path, (str(excel_path.resolve()), revolut_product))
+        for excel_path in excel_files
+    )
+
+    extracted = {}
+    fingerprints = {}
+    if use_cache:
+        cache_entries = load_cache(TRANSACTIONS_CACHE_NAME, TRANSACTIONS_CACHE_VERSION)
+        for file_path, cache_key in cache_keys.items():
+            fingerprints[file_path] = _file_fingerprint(file_path)
+            entry = cache_entries.get(cache_key)
+            if entry and entry[0] == fingerprints[file_path]:
+                extracted[file_path] = entry[1]
+                print(f"[CACHED] {file_path.name}: {len(entry[1])} transactions")
+
+    pdf_files_to_extract = [p for p in pdf_files if p not in extracted]
+    excel_files_to_extract = [p for p in excel_files if p not in extracted]
+
+    # Each file is an independent, CPU-bound extraction; map() keeps file order
+    use_pool = (
+        max_workers > 1 and len(pdf_files_to_extract) + len(excel_files_to_extract) > 1
+    )
+    with (
+        ProcessPoolExecutor(max_workers=max_workers) if use_pool else nullcontext()
+    ) as executor:
+        map_files = executor.map if executor else map
+
+        # PDF files (AIB) and Excel files (Revolut) are queued together
+        pdf_transactions = map_files(_extract_pdf_transactions, pdf_files_to_extract)
+        excel_transactions = map_files(
+            _extract_excel_transactions,
+            excel_files_to_extract,
+            repeat(revolut_product),
+        )
 
-    # Process PDF files (AIB)
-    pdf_files = sorted(statements_dir.glob("*.pdf"))
-    for pdf_path in pdf_files:
-        transactions = _extract_pdf_transactions(pdf_path)
-        if transactions:
-            results[str(pdf_path)] = transactions
+        newly_extracted = dict(zip(pdf_files_to_extract, pdf_transactions))
+        newly_extracted.update(zip(excel_files_to_extract, excel_transactions))
+
+    if use_cache:
+        # Files without transactions are not cached so their warnings show again
+        new_entries = {
+            cache_keys[file_path]: (fingerprints[file_path], transactions)
+            for file_path, transactions in newly_extracted.items()
+            if transactions
+        }
+        if new_entries:
+            cache_entries.update(new_entries)
+            save_cache(
+                TRANSACTIONS_CACHE_NAME, TRANSACTIONS_CACHE_VERSION, cache_entries
+            )
 
-    # Process Excel files (Revolut)
-    excel_files = sorted(statements_dir.glob("*.xlsx"))
-    for excel_path in excel_files:
-        transactions = _extract_excel_transactions(excel_path, revolut_product)
-        if transactions:
-            results[str(excel_path)] = transactions
+    extracted.update(newly_extracted)
+
+    results = {}
+    for file_path in pdf_files + excel_files:
+        if extracted[file_path]:
+            results[str(file_path)] = extracted[file_path]
 
     return results
 
 
 def _extract_pdf_transactions(pdf_path: Path) -> list[Transaction]:
     """Extract transactions from a PDF statement (AIB)."""
-    result = parse_statement(pdf_path)
+    result = parse_pdf(pdf_path)
     if not result:
         print(f"WARNING: Could not parse {pdf_path.name}")
         return []
 
-    start_date, end_date, parser_name = result
-
-    # Get parser instance and extract transactions
-    if parser_name == "AIB Debit Account":
-        parser = AIBDebitParser()
-        transactions = parser.extract_transactions(pdf_path)
-    elif parser_name == "AIB Credit Card":
-        parser = AIBCreditParser()
-        transactions = parser.extract_transactions(pdf_path)
-    else:
-        print(f"WARNING: Transaction extraction not implemented for {parser_name}")
-        return []
+    _, (start_date, end_date), transactions = result
 
     if transactions:
         print(
@@ -91,6 +178,11 @@ def _extract_excel_transactions(
     excel_path: Path, product: str = "Current"
 ) -> list[Transaction]:
     """Extract transactions from an Excel statement (Revolut)."""
+    # Imported here since pandas is slow to import and PDF-only runs never need it
+    from parsers.revolut_excel_transaction_extractor import (
+        RevolutExcelTransactionExtractor,
+    )
+
     extractor = RevolutExcelTransactionExtractor(product=product)
 
     if not extractor.can_parse(excel_path):
@@ -109,6 +201,30 @@ def _extract_excel_transactions(
     return transactions
 
 
+def _running_balance(start: float, transactions: list[Transaction]) -> float:
+    """
+    Apply transactions' signed amounts and fees to a starting balance, in order.
+
+    The signed amounts and fees are laid out in one array and summed with a
+    sequential accumulate, which performs the same floating-point operations in
+    the same order as a Python loop would.
+    """
+    count = len(transactions)
+    if not count:
+        return start
+
+    deltas = np.empty(2 * count + 1)
+    deltas[0] = start
+    deltas[1::2] = np.fromiter(
+        (tx.signed_amount for tx in transactions), np.float64, count
+    )
+    # Fees are subtracted if present (Revolut transactions)
+    deltas[2::2] = np.fromiter(
+        (-(tx.fee or 0.0) for tx in transactions), np.float64, count
+    )
+    return float(np.add.accumulate(deltas)[-1])
+
+
 def analyze_debit_balances(transactions: list[Transaction]) -> dict | None:
     """
     Analyze balances for debit account transactions.
@@ -119,94 +235,85 @@ def analyze_debit_balances(transactions: list[Transaction]) -> dict | None:
     if not transactions:
         return None
 
-    # Filter for debit account transactions (they have balance field)
-    debit_txs = [tx for tx in transactions if tx.balance is not None]
-    if not debit_txs:
-        return None
+    # Sort a single time; the sort is stable, so debit transactions (those with
+    # a stated balance) keep the same order they would have if sorted on their own
+    sorted_txs = sorted(transactions, key=attrgetter("date_parsed"))
 
-    # Sort by date to find earliest and latest
-    sorted_txs = sorted(debit_txs, key=lambda tx: parse_date(tx.transaction_date))
-
-    # Skip OPENING BALANCE/BALANCE FORWARD entries when finding earliest transaction
-    # They represent the starting balance, not a transaction that changes it
+    # Single pass over the sorted transactions. OPENING BALANCE/BALANCE FORWARD
+    # entries represent the starting balance, not a transaction that changes it,
+    # so they only count towards the first/latest debit transaction.
+    first_debit_tx = None
     earliest_tx = None
+    latest_tx = None
+    # Amounts are collected and summed with math.fsum, which rounds correctly
+    # regardless of order or count
+    debit_amounts = []
+    credit_amounts = []
+    fee_amounts = []
+    # The running balance is reset to each stated balance (in case of
+    # discrepancies), so only transactions after the last one need applying
+    last_balance_tx = None
+    txs_after_last_balance = []
+
     for tx in sorted_txs:
-        if (
-            "BALANCE FORWARD" not in tx.details.upper()
-            and "OPENING BALANCE" not in tx.details.upper()
-        ):
-            earliest_tx = tx
-            break
+        if tx.balance is not None:
+            if first_debit_tx is None:
+                first_debit_tx = tx
+            latest_tx = tx
+
+        if tx.is_balance_marker:
+            continue
+
+        if tx.transaction_type == "Debit":
+            debit_amounts.append(tx.amount)
+        elif tx.transaction_type == "Credit":
+            credit_amounts.append(tx.amount)
+        # Fees (Revolut transactions may have separate fees)
+        if tx.fee:
+            fee_amounts.append(tx.fee)
+
+        if tx.balance is not None:
+            # The first non-marker transaction with a balance is the earliest
+            if earliest_tx is None:
+                earliest_tx = tx
+            last_balance_tx = tx
+            txs_after_last_balance.clear()
+        else:
+            txs_after_last_balance.append(tx)
+
+    # Only debit account transactions have a balance field
+    if first_debit_tx is None:
+        return None
+
+    total_debits = math.fsum(debit_amounts)
+    total_credits = math.fsum(credit_amounts)
+    total_fees = math.fsum(fee_amounts)
 
     # If all transactions are OPENING BALANCE, use the first one
     if earliest_tx is None:
-        earliest_tx = sorted_txs[0]
-
-    latest_tx = sorted_txs[-1]
+        earliest_tx = first_debit_tx
 
     # Starting balance (STATED): the balance shown in the statement for the earliest transaction date
     # This is the balance AFTER the first transaction
     stated_starting_balance = earliest_tx.balance
 
     # Starting balance (for calculation): the balance BEFORE the first transaction
-    # If first transaction is a debit, balance before = balance after + amount
-    # If first transaction is a credit, balance before = balance after - amount
-    if earliest_tx.transaction_type == "Debit":
-        calculated_starting_balance = earliest_tx.balance + earliest_tx.amount
-    else:
-        calculated_starting_balance = earliest_tx.balance - earliest_tx.amount
+    # (balance after minus the signed amount: debits add back, credits subtract)
+    calculated_starting_balance = earliest_tx.balance - earliest_tx.signed_amount
 
     # Ending balance: use the stated balance from the latest transaction with a balance
-    # But also calculate it by processing all transactions to verify
     ending_balance = latest_tx.balance
 
-    # Calculate total debits and credits (fees are handled separately in the running balance loop)
-    # Exclude BALANCE FORWARD/OPENING BALANCE entries (they have amount 0.00 and are not real transactions)
-    total_debits = sum(
-        tx.amount
-        for tx in transactions
-        if tx.transaction_type == "Debit"
-        and "BALANCE FORWARD" not in tx.details.upper()
-        and "OPENING BALANCE" not in tx.details.upper()
-    )
-    total_credits = sum(
-        tx.amount
-        for tx in transactions
-        if tx.transaction_type == "Credit"
-        and "BALANCE FORWARD" not in tx.details.upper()
-        and "OPENING BALANCE" not in tx.details.upper()
+    # The running balance continues from the last stated balance; without any,
+    # it starts from the calculated starting balance and applies every transaction
+    running_balance = _running_balance(
+        (
+            last_balance_tx.balance
+            if last_balance_tx is not None
+            else calculated_starting_balance
+        ),
+        txs_after_last_balance,
     )
-    # Sum of fees (Revolut transactions may have separate fees)
-    total_fees = sum(
-        tx.fee or 0.0
-        for tx in transactions
-        if "BALANCE FORWARD" not in tx.details.upper()
-        and "OPENING BALANCE" not in tx.details.upper()
-    )
-
-    # For debit accounts: starting balance decreases with debits, increases with credits
-    calculated_ending = calculated_starting_balance - total_debits + total_credits
-
-    # Also calculate ending balance by processing transactions in order (more accurate)
-    # This handles cases where some transactions don't have explicit balances
-    running_balance = calculated_starting_balance
-    for tx in sorted(transactions, key=lambda tx: parse_date(tx.transaction_date)):
-        if (
-            "BALANCE FORWARD" in tx.details.upper()
-            or "OPENING BALANCE" in tx.details.upper()
-        ):
-            continue  # Skip opening balance entries
-        if tx.transaction_type == "Debit":
-            running_balance -= tx.amount
-        else:
-            running_balance += tx.amount
-        # Subtract fee if present (Revolut transactions)
-        if tx.fee:
-            running_balance -= tx.fee
-        # If this transaction has a stated balance, use it to verify/correct running balance
-        if tx.balance is not None:
-            # Update running balance to match stated balance (in case of discrepancies)
-            running_balance = tx.balance
 
     # Use the calculated running balance as the final calculated ending
     calculated_ending_from_running = running_balance
@@ -228,9 +335,7 @@ def analyze_debit_balances(transactions: list[Transaction]) -> dict | None:
 
 def print_transaction_summary(transactions_by_file: dict[str, list[Transaction]]):
     """Print summary statistics about transactions."""
-    all_transactions = []
-    for transactions in transactions_by_file.values():
-        all_transactions.extend(transactions)
+    all_transactions = list(chain.from_iterable(transactions_by_file.values()))
 
     if not all_transactions:
         print("\nNo transactions found.")
@@ -240,19 +345,26 @@ def print_transaction_summary(transactions_by_file: dict[str, list[Transaction]]
     print(f"Total transactions: {len(all_transactions)}")
     print(f"Total files processed: {len(transactions_by_file)}")
 
-    # Group by type
-    by_type = defaultdict(int)
-    by_currency = defaultdict(int)
-    total_debit = 0.0
-    total_credit = 0.0
+    # Aggregate with NumPy reductions instead of a per-transaction Python loop
+    count = len(all_transactions)
+    amounts = np.fromiter(
+        (tx.amount for tx in all_transactions), dtype=np.float64, count=count
+    )
+    fees = np.fromiter(
+        (tx.fee or 0.0 for tx in all_transactions), dtype=np.float64, count=count
+    )
+    is_debit = np.fromiter(
+        (tx.transaction_type == "Debit" for tx in all_transactions),
+        dtype=bool,
+        count=count,
+    )
 
-    for tx in all_transactions:
-        by_type[tx.transaction_type] += 1
-        by_currency[tx.currency] += 1
-        if tx.transaction_type == "Debit":
-            total_debit += tx.amount
-        else:
-            total_credit += tx.amount
+    # Group by type and currency
+    by_type = Counter(tx.transaction_type for tx in all_transactions)
+    by_currency = Counter(tx.currency for tx in all_transactions)
+
+    total_debit = float(amounts[is_debit].sum())
+    total_credit = float(amounts[~is_debit].sum())
 
     print(f"\nBy type:")
     for tx_type, count in sorted(by_type.items()):
@@ -263,7 +375,7 @@ def print_transaction_summary(transactions_by_file: dict[str, list[Transaction]]
         print(f"  {currency}: {count}")
 
     # Sum of fees (Revolut transactions)
-    total_fees = sum(tx.fee or 0.0 for tx in all_transactions)
+    total_fees = float(fees.sum())
 
     net_amount = total_credit - total_debit - total_fees
 
@@ -285,7 +397,7 @@ def print_transaction_summary(transactions_by_file: dict[str, list[Transaction]]
     for file_path, transactions in transactions_by_file.items():
         balance_info = analyze_debit_balances(transactions)
         if balance_info:
-            debit_files[file_path] = balance_info
+            debit_files[file_path] = (balance_info, transactions)
             file_name = Path(file_path).name
             print(f"\n{file_name}:")
             print(
@@ -308,39 +420,33 @@ def print_transaction_summary(transactions_by_file: dict[str, list[Transaction]]
 
     # Aggregate analysis: Collect ALL transactions, deduplicate, sort by date, and analyze
     if debit_files:
-        # Collect all transactions from all debit files
-        all_debit_transactions = []
-        for file_path, transactions in transactions_by_file.items():
-            balance_info = analyze_debit_balances(transactions)
-            if balance_info:  # Only include files with balance info (debit accounts)
-                all_debit_transactions.extend(transactions)
+        # Collect all transactions from all debit files (files with balance info)
+        all_debit_transactions = list(
+            chain.from_iterable(
+                transactions for _, transactions in debit_files.values()
+            )
+        )
 
         if all_debit_transactions:
             # Deduplicate transactions (files may overlap, causing same transaction to appear multiple times)
-            # Use a signature: date, amount, type, and details (first 100 chars) to identify duplicates
-            seen_signatures = set()
-            unique_transactions = []
+            # Transactions with the same dedup_key are the same transaction; the
+            # dict keeps the first occurrence, in first-seen order
+            unique_by_key = {}
             for tx in all_debit_transactions:
-                # Create signature for deduplication
-                sig = (
-                    tx.transaction_date,
-                    tx.amount,
-                    tx.transaction_type,
-                    tx.details[:100],
-                )
-                if sig not in seen_signatures:
-                    seen_signatures.add(sig)
-                    unique_transactions.append(tx)
+                unique_by_key.setdefault(tx.dedup_key, tx)
+            unique_transactions = list(unique_by_key.values())
 
             duplicates_removed = len(all_debit_transactions) - len(unique_transactions)
 
-            # Sort all unique transactions chronologically by date
-            sorted_all_txs = sorted(
-                unique_transactions, key=lambda tx: parse_date(tx.transaction_date)
-            )
-
-            # Analyze the sorted transactions
-            aggregate_info = analyze_debit_balances(sorted_all_txs)
+            if len(debit_files) == 1 and duplicates_removed == 0:
+                # Same transactions as the single per-file analysis above, and
+                # both sort stably by date, so its result is reused as is
+                ((aggregate_info, _),) = debit_files.values()
+            else:
+                # Sort all unique transactions chronologically by date and analyze
+                aggregate_info = analyze_debit_balances(
+                    sorted(unique_transactions, key=attrgetter("date_parsed"))
+                )
 
             if aggregate_info:
                 print(
@@ -351,7 +457,7 @@ def print_transaction_summary(transactions_by_file: dict[str, list[Transaction]]
                     print(
                         f"  Duplicates removed: {duplicates_removed} (from overlapping files)"
                     )
-                print(f"  Unique transactions analyzed: {len(sorted_all_txs)}")
+                print(f"  Unique transactions analyzed: {len(unique_transactions)}")
                 print(
                     f"  Period: {aggregate_info['earliest_date']} to {aggregate_info['latest_date']}"
                 )
@@ -407,12 +513,18 @@ def main():
     product = sys.argv[2] if len(sys.argv) > 2 else "Current"
 
     print(f"Analyzing transactions from: {statements_dir}")
-    if any(statements_dir.glob("*.xlsx")):
+    pdf_files, excel_files = list_statement_files(statements_dir)
+    if excel_files:
         print(f"Revolut product filter: {product}")
     print()
 
     transactions_by_file = analyze_transactions_directory(
-        statements_dir, revolut_product=product
+        statements_dir,
+        revolut_product=product,
+        max_workers=os.cpu_count() or 1,
+        use_cache=True,
+        pdf_files=pdf_files,
+        excel_files=excel_files,
     )
     print_transaction_summary(transactions_by_file)
 
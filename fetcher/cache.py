@@ -0,0 +1,66 @@
+"""Persistent on-disk caches shared by the analysis scripts."""
+
+import os
+import pickle
+import tempfile
+from pathlib import Path
+
+CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "financial-megaanalyzer"
+)
+
+
+def load_cache(name: str, version: int) -> dict:
+    """
+    Load a named cache from CACHE_DIR.
+
+    Args:
+        name: Cache name, used as the file name
+        version: Expected cache format version
+
+    Returns:
+        Cached entries, or an empty dict if the cache is missing, unreadable
+        or was written with a different version
+    """
+    try:
+        with open(CACHE_DIR / f"{name}.pkl", "rb") as f:
+            stored_version, entries = pickle.load(f)
+    except Exception:
+        # Besides I/O errors, unpickling a stale cache can fail in many ways,
+        # e.g. AttributeError or ImportError once a pickled class has moved
+        return {}
+
+    if stored_version != version or not isinstance(entries, dict):
+        return {}
+    return entries
+
+
+def save_cache(name: str, version: int, entries: dict) -> None:
+    """
+    Save a named cache to CACHE_DIR.
+
+    The file is replaced atomically so an interrupted run never leaves a
+    truncated cache behind. Failures are ignored since the cache is only an
+    optimization.
+
+    Args:
+        name: Cache name, used as the file name
+        version: Cache format version stored alongside the entries
+        entries: Entries to store
+    """
+    temp_path = None
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=CACHE_DIR, prefix=f"{name}.", suffix=".tmp", delete=False
+        ) as f:
+            temp_path = f.name
+            pickle.dump((version, entries), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, CACHE_DIR / f"{name}.pkl")
+    except Exception:
+        if temp_path is not None:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
@@ -13,19 +13,23 @@ def pytest_collection_modifyitems(items):
     of the docstring becomes the test name in reports. For parameterized tests,
     the parameter ID is preserved.
     """
+    # Parameterized tests share a function, so each docstring is summarized once
+    summaries = {}
     for item in items:
-        doc = item.function.__doc__
-        if doc:
-            # Get the first non-empty line from the docstring
-            summary = next(
-                (line.strip() for line in doc.strip().splitlines() if line.strip()),
-                None,
+        function = item.function
+        if function not in summaries:
+            doc = function.__doc__
+            # After lstrip(), the first line of the docstring is its first
+            # non-empty line
+            summaries[function] = (
+                doc.lstrip().partition("\n")[0].rstrip() if doc else ""
             )
-            if summary:
-                if hasattr(item, "callspec"):
-                    # For parameterized tests, preserve parameter id from the original nodeid
-                    start = item.nodeid.find("[")
-                    param_part = item.nodeid[start:] if start != -1 else ""
-                    item._nodeid = summary + param_part
-                else:
-                    item._nodeid = summary
+        summary = summaries[function]
+        if summary:
+            if hasattr(item, "callspec"):
+                # For parameterized tests, preserve parameter id from the original nodeid
+                start = item.nodeid.find("[")
+                param_part = item.nodeid[start:] if start != -1 else ""
+                item._nodeid = summary + param_part
+            else:
+                item._nodeid = summary
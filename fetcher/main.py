@@ -3,18 +3,15 @@
 
 def read_pdf(pdf_path: str) -> str:
     """Read text from a PDF file."""
-    from pypdf import PdfReader
+    from parsers.pdf_text import PdfReader
 
-    reader = PdfReader(pdf_path)
-    text = ""
-    for page in reader.pages:
-        text += page.extract_text() or ""
-    return text
+    with PdfReader(pdf_path) as reader:
+        return "".join(page.extract_text() for page in reader.pages)
 
 
 def main():
     print("Hello from Financial Statement Fetcher!")
-    print("PDF libraries ready: pypdf, pdfplumber, pymupdf")
+    print("PDF library ready: pymupdf")
     print("SQLite: built-in with Python")
 
 
@@ -1,12 +1,13 @@
-"""Pydantic models for statement analysis."""
+"""Data models for statement analysis."""
 
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
-from pydantic import BaseModel, Field
 
-
-class StatementInfo(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class StatementInfo:
     """Information about a single statement file."""
 
     file_name: str
@@ -17,11 +18,22 @@ class StatementInfo(BaseModel):
     end_date_parsed: Optional[datetime] = None
     modified_timestamp: datetime
     file_signature: str
+    """BLAKE3 hex digest of the file content, used for duplicate detection."""
     error: Optional[str] = None
     parser_name: Optional[str] = None
 
+    # Derived fields, computed once at construction
+    modified_str: str = field(init=False, repr=False, compare=False)
+    """Modification time formatted as 'YYYY-MM-DD HH:MM:SS' for reports."""
+
+    def __post_init__(self):
+        self.modified_str = self.modified_timestamp.isoformat(
+            sep=" ", timespec="seconds"
+        )
 
-class StatementBreak(BaseModel):
+
+@dataclass(slots=True, kw_only=True)
+class StatementBreak:
     """Information about a gap between consecutive statements."""
 
     previous_file: str
@@ -31,33 +43,51 @@ class StatementBreak(BaseModel):
     gap_days: int
 
 
-class DuplicateGroup(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class DuplicateGroup:
     """Group of duplicate files with the same content."""
 
     signature: str
-    files: list[str] = Field(default_factory=list)
+    files: list[str] = field(default_factory=list)
 
 
-class AnalysisSummary(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class AnalysisSummary:
     """Summary analysis of all statements."""
 
     total_files: int
     continuous_period_start: str
     continuous_period_end: str
     total_days_covered: int
-    duplicates: list[DuplicateGroup] = Field(default_factory=list)
-    breaks: list[StatementBreak] = Field(default_factory=list)
+    duplicates: list[DuplicateGroup] = field(default_factory=list)
+    breaks: list[StatementBreak] = field(default_factory=list)
 
 
-class StatementsAnalysis(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class StatementsAnalysis:
     """Complete analysis of statements."""
 
-    statements: list[StatementInfo] = Field(default_factory=list)
+    statements: list[StatementInfo] = field(default_factory=list)
     summary: AnalysisSummary
 
 
-class Transaction(BaseModel):
-    """A single transaction record from a statement."""
+@lru_cache(maxsize=None)
+def _parse_transaction_date(date_str: str) -> Optional[datetime]:
+    """Parse a 'DD MMM YYYY' date, or return None if it is not in that format."""
+    try:
+        return datetime.strptime(date_str, "%d %b %Y")
+    except ValueError:
+        return None
+
+
+@dataclass(slots=True, kw_only=True)
+class Transaction:
+    """
+    A single transaction record from a statement.
+
+    Parsers build thousands of these from already-typed values, and the
+    analysis loops read their attributes heavily.
+    """
 
     # Mandatory fields
     amount: float
@@ -88,3 +118,29 @@ class Transaction(BaseModel):
     """Posting date in 'DD MMM YYYY' format (for credit accounts)."""
     fee: Optional[float] = None
     """Transaction fee (e.g., Revolut fees separate from amount)."""
+
+    # Derived fields, computed once at construction
+    date_parsed: Optional[datetime] = field(init=False, repr=False, compare=False)
+    """transaction_date as a datetime, or None if it is not a 'DD MMM YYYY' date."""
+    is_balance_marker: bool = field(init=False, repr=False, compare=False)
+    """Whether this is an OPENING BALANCE/BALANCE FORWARD entry rather than a real transaction."""
+    dedup_key: tuple = field(init=False, repr=False, compare=False)
+    """Date, amount, type and details (first 100 chars) identifying this transaction across overlapping statements."""
+    signed_amount: float = field(init=False, repr=False, compare=False)
+    """Amount as applied to the balance: negative for debits, positive otherwise (fees excluded)."""
+
+    def __post_init__(self):
+        self.date_parsed = _parse_transaction_date(self.transaction_date)
+        details_upper = self.details.upper()
+        self.is_balance_marker = (
+            "BALANCE FORWARD" in details_upper or "OPENING BALANCE" in details_upper
+        )
+        self.dedup_key = (
+            self.transaction_date,
+            self.amount,
+            self.transaction_type,
+            self.details[:100],
+        )
+        self.signed_amount = (
+            -self.amount if self.transaction_type == "Debit" else self.amount
+        )
@@ -1,10 +1,21 @@
 """PDF statement parsers with auto-detection registry."""
 
 from .base import StatementParser
-from .registry import parse_statement, register_parser, get_registered_parsers
+from .batch import parse_many, parse_pdf
+from .registry import (
+    detect_parser,
+    detect_parsers,
+    parse_statement,
+    register_parser,
+    get_registered_parsers,
+)
 
 __all__ = [
     "StatementParser",
+    "detect_parser",
+    "detect_parsers",
+    "parse_many",
+    "parse_pdf",
     "parse_statement",
     "register_parser",
     "get_registered_parsers",
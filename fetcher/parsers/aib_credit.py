@@ -3,21 +3,126 @@
 import logging
 import re
 from pathlib import Path
-from datetime import datetime
+from typing import Callable, Iterator
 
-from pypdf import PdfReader
+from models import Transaction
+
+from .pdf_text import PdfReader
 
 logger = logging.getLogger(__name__)
 
-# Import Transaction model - handle both relative and absolute imports
-try:
-    from models import Transaction
-except ImportError:
-    import sys
-    from pathlib import Path
 
-    sys.path.insert(0, str(Path(__file__).parent.parent))
-    from models import Transaction
+# Regex patterns for statement parsing
+# Statement date, e.g. "Account Statement - 11th January, 2026"
+STATEMENT_DATE_PATTERN = re.compile(
+    r"Account Statement - (\d{1,2})(?:st|nd|rd|th)?\s+(\w+),\s+(\d{4})"
+)
+# First transaction date on a page: "DD MMM DD MMM" (transaction date, posting date)
+FIRST_TRANSACTION_PATTERN = re.compile(r"(\d{1,2})\s+(\w{3})\s+\d{1,2}\s+\w{3}\s+[A-Z]")
+TRANSACTIONS_HEADER_PATTERN = re.compile(r"Transaction\s+Date\s+Posting\s+Date")
+# Last token of a transaction line: "<amount>" or "<amount>CR"
+TRANSACTION_AMOUNT_PATTERN = re.compile(r"(-?\d{1,3}(?:,\d{3})*\.?\d*)(CR)?")
+TRANSACTION_START_PATTERN = re.compile(r"\d{1,2}\s+\w{3}\s+\d{1,2}\s+\w{3}")
+REFERENCE_PATTERN = re.compile(r"Ref:\s*(\d+)")
+# Foreign currency info: "XX.XX USD @ rate of X.XXXXXX"
+FX_PATTERN = re.compile(r"(\d+\.?\d*)\s+([A-Z]{3})\s+@\s+rate\s+of\s+(\d+\.?\d+)")
+FX_FEE_PATTERN = re.compile(r"Currency Conversion Fee of\s+(\d+\.?\d+)")
+
+# Full month names as printed in the statement date, mapped to abbreviations
+MONTH_ABBREVIATIONS = {
+    "January": "Jan",
+    "February": "Feb",
+    "March": "Mar",
+    "April": "Apr",
+    "May": "May",
+    "June": "Jun",
+    "July": "Jul",
+    "August": "Aug",
+    "September": "Sep",
+    "October": "Oct",
+    "November": "Nov",
+    "December": "Dec",
+}
+MONTH_NUMBERS = {
+    abbr: number for number, abbr in enumerate(MONTH_ABBREVIATIONS.values(), start=1)
+}
+
+
+def _month_number(month_abbr: str) -> int:
+    """
+    Get the month number for a month abbreviation.
+
+    A dict lookup in place of datetime.strptime(month_abbr, "%b").month, which
+    is far slower; like %b, it is case-insensitive.
+
+    Raises:
+        ValueError: If month_abbr is not a month abbreviation
+    """
+    try:
+        return MONTH_NUMBERS[month_abbr.capitalize()]
+    except KeyError:
+        raise ValueError(f"Invalid month: {month_abbr!r}") from None
+
+
+def _is_word(token: str) -> bool:
+    """Whether every character of token matches the regex \\w."""
+    return token.isalnum() or all(char.isalnum() or char == "_" for char in token)
+
+
+def _split_transaction_line(line: str) -> tuple[str, ...] | None:
+    """
+    Split a transaction line into its fields.
+
+    Transaction lines have a fixed layout, "DD MMM DD MMM <details> <amount>"
+    with an optional "CR" suffix on the amount, so splitting on whitespace is
+    much faster than matching the whole line with a regex. The result is the
+    same as matching (\\d{1,2})\\s+(\\w{3})\\s+(\\d{1,2})\\s+(\\w{3})\\s+(.+?)\\s+
+    followed by TRANSACTION_AMOUNT_PATTERN to the end of the line.
+
+    Args:
+        line: A line with no leading or trailing whitespace
+
+    Returns:
+        Tuple of (transaction day, transaction month, posting day, posting
+        month, details, amount, "CR" or None), or None if the line is not a
+        transaction
+    """
+    fields = line.split(None, 4)
+    if len(fields) < 5:
+        return None
+
+    trans_day, trans_month, post_day, post_month, rest = fields
+    if not (
+        len(trans_day) <= 2
+        and trans_day.isdecimal()
+        and len(post_day) <= 2
+        and post_day.isdecimal()
+        and len(trans_month) == 3
+        and _is_word(trans_month)
+        and len(post_month) == 3
+        and _is_word(post_month)
+    ):
+        return None
+
+    # The amount is the last token; everything before it is the details
+    details_and_amount = rest.rsplit(None, 1)
+    if len(details_and_amount) < 2:
+        return None
+    details, amount_token = details_and_amount
+
+    amount_match = TRANSACTION_AMOUNT_PATTERN.fullmatch(amount_token)
+    if not amount_match:
+        return None
+
+    return (
+        trans_day,
+        trans_month,
+        post_day,
+        post_month,
+        details,
+        amount_match.group(1),
+        amount_match.group(2),
+    )
 
 
 class AIBCreditParser:
@@ -37,280 +142,344 @@ class AIBCreditParser:
             Tuple of (start_date, end_date) as strings in 'DD MMM YYYY' format,
             or None if dates cannot be extracted.
         """
+        reader = None
         try:
             reader = PdfReader(pdf_path)
+            pages = reader.pages
 
-            # Extract end date from last page
-            end_date = None
-            end_year = None
+            # Each page is extracted at most once, although the end and start
+            # date searches may both visit it
+            page_texts = {}
 
-            for page in reversed(reader.pages):
-                page_text = page.extract_text()
-                if not page_text:
-                    continue
+            def page_text_at(index):
+                if index not in page_texts:
+                    page_texts[index] = pages[index].extract_text()
+                return page_texts[index]
 
-                # Pattern: "Account Statement - 11th January, 2026"
-                statement_match = re.search(
-                    r"Account Statement - (\d{1,2})(?:st|nd|rd|th)?\s+(\w+),\s+(\d{4})",
-                    page_text,
-                )
+            return self._extract_dates_from_pages(len(pages), page_text_at)
+        except Exception as e:
+            logger.error(
+                f"Error extracting dates from {pdf_path.name}: {e}", exc_info=True
+            )
+            return None
+        finally:
+            # Free MuPDF's C-side document memory right away
+            if reader is not None:
+                reader.close()
+
+    def _extract_dates_from_pages(
+        self, page_count: int, page_text_at: Callable[[int], str]
+    ) -> tuple[str, str] | None:
+        """
+        Extract start and end dates from a statement's page texts.
 
-                if statement_match:
-                    day = statement_match.group(1)
-                    month_name = statement_match.group(2)
-                    year = statement_match.group(3)
-                    end_year = int(year)
-
-                    # Convert month name to abbreviation
-                    month_map = {
-                        "January": "Jan",
-                        "February": "Feb",
-                        "March": "Mar",
-                        "April": "Apr",
-                        "May": "May",
-                        "June": "Jun",
-                        "July": "Jul",
-                        "August": "Aug",
-                        "September": "Sep",
-                        "October": "Oct",
-                        "November": "Nov",
-                        "December": "Dec",
-                    }
-
-                    month_abbr = month_map.get(month_name)
-                    if month_abbr:
-                        end_date = f"{int(day)} {month_abbr} {year}"
-                        break
+        Args:
+            page_count: Number of pages in the statement
+            page_text_at: Returns the text of the page at the given index
 
-            if not end_date:
-                return None
+        Returns:
+            Tuple of (start_date, end_date), or None if there is no end date
+        """
+        # Extract end date from last page
+        end_date = None
+        end_month = None
+        end_year = None
+
+        # The statement header is almost always on the last or the first page,
+        # so those are checked before the pages in between (last to first);
+        # only the pages actually visited are loaded
+        if page_count > 1:
+            search_order = [page_count - 1, 0, *range(page_count - 2, 0, -1)]
+        else:
+            search_order = range(page_count)
+        for index in search_order:
+            page_text = page_text_at(index)
+            if not page_text:
+                continue
+
+            statement_match = STATEMENT_DATE_PATTERN.search(page_text)
+
+            if statement_match:
+                day = statement_match.group(1)
+                month_name = statement_match.group(2)
+                year = statement_match.group(3)
+                end_year = int(year)
+
+                # Convert month name to abbreviation
+                month_abbr = MONTH_ABBREVIATIONS.get(month_name)
+                if month_abbr:
+                    end_date = f"{int(day)} {month_abbr} {year}"
+                    end_month = MONTH_NUMBERS[month_abbr]
+                    break
 
-            # Extract start date from first transaction
-            # Transactions format: "13 Dec 15 Dec MERCHANT NAME"
-            start_date = None
+        if not end_date:
+            return None
 
-            for page in reader.pages:
-                page_text = page.extract_text()
-                if not page_text:
+        # Extract start date from first transaction
+        # Transactions format: "13 Dec 15 Dec MERCHANT NAME"
+        start_date = None
+
+        for index in range(page_count):
+            page_text = page_text_at(index)
+            if not page_text:
+                continue
+
+            # We want the first transaction date
+            first_match = FIRST_TRANSACTION_PATTERN.search(page_text)
+            if first_match:
+                day = first_match.group(1)
+                month_abbr = first_match.group(2)
+
+                # Determine year: if month is after statement month, it's previous year
+                # Otherwise same year as statement
+                try:
+                    trans_month = _month_number(month_abbr)
+
+                    if trans_month > end_month:
+                        year = end_year - 1
+                    else:
+                        year = end_year
+
+                    start_date = f"{int(day)} {month_abbr} {year}"
+                    break
+                except ValueError:
                     continue
 
-                # Look for transaction date pattern: "DD MMM DD MMM" (transaction date, posting date)
-                # We want the first transaction date
-                transaction_pattern = r"(\d{1,2})\s+(\w{3})\s+\d{1,2}\s+\w{3}\s+[A-Z]"
+        # If no transaction found, use end date as start
+        if not start_date:
+            start_date = end_date
 
-                matches = list(re.finditer(transaction_pattern, page_text))
-                if matches:
-                    first_match = matches[0]
-                    day = first_match.group(1)
-                    month_abbr = first_match.group(2)
+        return (start_date, end_date)
 
-                    # Determine year: if month is after statement month, it's previous year
-                    # Otherwise same year as statement
-                    try:
-                        trans_month = datetime.strptime(month_abbr, "%b").month
-                        end_month = datetime.strptime(end_date.split()[1], "%b").month
+    def extract_transactions(self, pdf_path: Path) -> list[Transaction]:
+        """
+        Extract transaction records from an AIB credit card statement.
 
-                        if trans_month > end_month:
-                            year = end_year - 1
-                        else:
-                            year = end_year
+        Returns:
+            List of Transaction objects
+        """
+        return self._collect_transactions(pdf_path, self.iter_transactions(pdf_path))
 
-                        start_date = f"{int(day)} {month_abbr} {year}"
-                        break
-                    except ValueError:
-                        continue
+    def iter_transactions(self, pdf_path: Path) -> Iterator[Transaction]:
+        """
+        Yield transaction records from an AIB credit card statement as parsed.
 
-            # If no transaction found, use end date as start
-            if not start_date:
-                start_date = end_date
+        Lets callers stream transactions instead of holding the whole list.
+        Unlike extract_transactions(), errors are raised rather than logged.
 
-            return (start_date, end_date)
+        Yields:
+            Transaction objects, in statement order
+        """
+        full_text = "\n".join(self._read_page_texts(pdf_path))
+        yield from self._iter_transactions_from_text(full_text)
 
+    def parse(self, pdf_path: Path) -> tuple[tuple[str, str] | None, list[Transaction]]:
+        """
+        Extract both dates and transactions, reading the PDF text only once.
+
+        Text extraction dominates parsing time, so callers that need both
+        should use this instead of extract_dates() and extract_transactions().
+
+        Returns:
+            Tuple of (dates, transactions), as returned by extract_dates() and
+            extract_transactions()
+        """
+        try:
+            page_texts = self._read_page_texts(pdf_path)
+        except Exception as e:
+            logger.error(f"Error reading {pdf_path.name}: {e}", exc_info=True)
+            return None, []
+
+        try:
+            dates = self._extract_dates_from_pages(
+                len(page_texts), page_texts.__getitem__
+            )
         except Exception as e:
             logger.error(
                 f"Error extracting dates from {pdf_path.name}: {e}", exc_info=True
             )
-            return None
+            dates = None
 
-    def extract_transactions(self, pdf_path: Path) -> list[Transaction]:
+        transactions = self._collect_transactions(
+            pdf_path, self._iter_transactions_from_text("\n".join(page_texts))
+        )
+        return dates, transactions
+
+    def _read_page_texts(self, pdf_path: Path) -> list[str]:
+        """Extract the text of every page of a PDF."""
+        reader = PdfReader(pdf_path)
+        try:
+            return [page.extract_text() or "" for page in reader.pages]
+        finally:
+            reader.close()
+
+    def _collect_transactions(
+        self, pdf_path: Path, transactions: Iterator[Transaction]
+    ) -> list[Transaction]:
         """
-        Extract transaction records from an AIB credit card statement.
+        Collect transactions into a list, logging any error.
 
         Returns:
-            List of Transaction objects
+            List of Transaction objects; partial results if parsing fails midway
         """
-        transactions = []
+        collected = []
         try:
-            reader = PdfReader(pdf_path)
-            full_text = ""
-            for page in reader.pages:
-                full_text += page.extract_text() + "\n"
-
-            # Find statement end date to determine year for transactions
-            end_date = None
-            end_year = None
-            statement_match = re.search(
-                r"Account Statement - (\d{1,2})(?:st|nd|rd|th)?\s+(\w+),\s+(\d{4})",
-                full_text,
+            for transaction in transactions:
+                collected.append(transaction)
+        except Exception as e:
+            # Log error but return partial results if any
+            logger.error(
+                f"Error extracting transactions from {pdf_path.name}: {e}",
+                exc_info=True,
             )
-            if statement_match:
-                end_year = int(statement_match.group(3))
-                month_map = {
-                    "January": "Jan",
-                    "February": "Feb",
-                    "March": "Mar",
-                    "April": "Apr",
-                    "May": "May",
-                    "June": "Jun",
-                    "July": "Jul",
-                    "August": "Aug",
-                    "September": "Sep",
-                    "October": "Oct",
-                    "November": "Nov",
-                    "December": "Dec",
-                }
-                month_name = statement_match.group(2)
-                month_abbr = month_map.get(month_name, "Jan")
-                end_date = f"{int(statement_match.group(1))} {month_abbr} {end_year}"
-
-            # Find transaction section
-            # Pattern: "Transaction Date Posting Date Details..."
-            trans_start = re.search(r"Transaction\s+Date\s+Posting\s+Date", full_text)
-            if not trans_start:
-                return transactions
-
-            trans_text = full_text[trans_start.end() :]
-            lines = trans_text.split("\n")
-
-            i = 0
-            while i < len(lines):
-                line = lines[i].strip()
-                if not line:
+
+        return collected
+
+    def _iter_transactions_from_text(self, full_text: str) -> Iterator[Transaction]:
+        """Yield transaction records parsed from a statement's full text."""
+        # Find statement end date to determine year for transactions
+        end_month = None
+        end_year = None
+        statement_match = STATEMENT_DATE_PATTERN.search(full_text)
+        if statement_match:
+            end_year = int(statement_match.group(3))
+            month_name = statement_match.group(2)
+            month_abbr = MONTH_ABBREVIATIONS.get(month_name, "Jan")
+            end_month = MONTH_NUMBERS[month_abbr]
+
+        # Find transaction section
+        # Pattern: "Transaction Date Posting Date Details..."
+        trans_start = TRANSACTIONS_HEADER_PATTERN.search(full_text)
+        if not trans_start:
+            return
+
+        # Lines are stripped once and blank lines dropped up front; both
+        # loops below skip blank lines, and the inner loop's stopping line
+        # is revisited by the outer loop
+        trans_text = full_text[trans_start.end() :]
+        lines = [
+            stripped for line in trans_text.split("\n") if (stripped := line.strip())
+        ]
+
+        i = 0
+        while i < len(lines):
+            line = lines[i]
+
+            # Transaction pattern: "DD MMM DD MMM <merchant> <amount>" or "<amount>CR"
+            # Example: "13 Dec 15 Dec TEST SUPERMARKET   3554 TEST CITY IE 35.72"
+            # Example: "5 Jan 5 Jan DIRECT DEBIT - THANK YOU 2,522.86CR"
+            # Amount may have commas: "2,522.86" or "35.72"
+            # Transactions start with a digit; the check skips splitting the
+            # many header and detail lines that don't
+            trans_fields = line[0].isdigit() and _split_transaction_line(line)
+            if trans_fields:
+                (
+                    trans_day,
+                    trans_month_abbr,
+                    post_day,
+                    post_month_abbr,
+                    details,
+                    amount_str,
+                    credit_suffix,
+                ) = trans_fields
+                trans_day = int(trans_day)
+                post_day = int(post_day)
+                if "," in amount_str:
+                    amount_str = amount_str.replace(",", "")  # Remove commas
+                amount = float(amount_str)
+                is_credit = credit_suffix == "CR"  # Check for CR suffix
+
+                # Determine year for transaction date
+                try:
+                    trans_month = _month_number(trans_month_abbr)
+                    if end_month:
+                        if trans_month > end_month:
+                            year = end_year - 1
+                        else:
+                            year = end_year
+                    else:
+                        year = end_year if end_year else 2025
+
+                    transaction_date = f"{trans_day} {trans_month_abbr} {year}"
+                    posting_date = f"{post_day} {post_month_abbr} {year}"
+                except (ValueError, AttributeError):
                     i += 1
                     continue
 
-                # Transaction pattern: "DD MMM DD MMM <merchant> <amount>" or "<amount>CR"
-                # Example: "13 Dec 15 Dec TEST SUPERMARKET   3554 TEST CITY IE 35.72"
-                # Example: "5 Jan 5 Jan DIRECT DEBIT - THANK YOU 2,522.86CR"
-                # Amount may have commas: "2,522.86" or "35.72"
-                trans_match = re.match(
-                    r"(\d{1,2})\s+(\w{3})\s+(\d{1,2})\s+(\w{3})\s+(.+?)\s+(-?\d{1,3}(?:,\d{3})*\.?\d*)(CR)?$",
-                    line,
-                )
-                if trans_match:
-                    trans_day = int(trans_match.group(1))
-                    trans_month_abbr = trans_match.group(2)
-                    post_day = int(trans_match.group(3))
-                    post_month_abbr = trans_match.group(4)
-                    details = trans_match.group(5).strip()
-                    amount_str = trans_match.group(6).replace(",", "")  # Remove commas
-                    amount = float(amount_str)
-                    is_credit = trans_match.group(7) == "CR"  # Check for CR suffix
-
-                    # Determine year for transaction date
-                    try:
-                        trans_month = datetime.strptime(trans_month_abbr, "%b").month
-                        if end_date:
-                            end_month = datetime.strptime(
-                                end_date.split()[1], "%b"
-                            ).month
-                            if trans_month > end_month:
-                                year = end_year - 1
-                            else:
-                                year = end_year
-                        else:
-                            year = end_year if end_year else 2025
+                # Get reference number from next line(s)
+                reference = None
+                original_currency = None
+                original_amount = None
+                exchange_rate = None
+                fx_fee = None
+
+                i += 1
+                while i < len(lines):
+                    next_line = lines[i]
+
+                    # Check if this is a new transaction (digit check first,
+                    # as most follow-on lines are references or FX details)
+                    if next_line[0].isdigit() and TRANSACTION_START_PATTERN.match(
+                        next_line
+                    ):
+                        break
 
-                        transaction_date = f"{trans_day} {trans_month_abbr} {year}"
-                        posting_date = f"{post_day} {post_month_abbr} {year}"
-                    except (ValueError, AttributeError):
+                    # Follow-on lines are tried in priority order: reference,
+                    # foreign currency info, then FX fee. Each regex only runs
+                    # when the line contains its literal marker.
+                    ref_match = "Ref:" in next_line and REFERENCE_PATTERN.search(
+                        next_line
+                    )
+                    if ref_match:
+                        reference = ref_match.group(1)
                         i += 1
                         continue
 
-                    # Get reference number from next line(s)
-                    reference = None
-                    original_currency = None
-                    original_amount = None
-                    exchange_rate = None
-                    fx_fee = None
-
-                    i += 1
-                    while i < len(lines):
-                        next_line = lines[i].strip()
-                        if not next_line:
-                            i += 1
-                            continue
-
-                        # Check if this is a new transaction
-                        if re.match(r"\d{1,2}\s+\w{3}\s+\d{1,2}\s+\w{3}", next_line):
-                            break
-
-                        # Reference number
-                        ref_match = re.search(r"Ref:\s*(\d+)", next_line)
-                        if ref_match:
-                            reference = ref_match.group(1)
-                            i += 1
-                            continue
-
-                        # Foreign currency info
-                        # Format: "XX.XX USD @ rate of X.XXXXXX"
-                        fx_match = re.search(
-                            r"(\d+\.?\d*)\s+([A-Z]{3})\s+@\s+rate\s+of\s+(\d+\.?\d+)",
-                            next_line,
-                        )
-                        if fx_match:
-                            original_amount = float(fx_match.group(1))
-                            original_currency = fx_match.group(2)
-                            exchange_rate = float(fx_match.group(3))
-                            i += 1
-                            continue
-
-                        # FX fee
-                        fx_fee_match = re.search(
-                            r"Currency Conversion Fee of\s+(\d+\.?\d+)", next_line
-                        )
-                        if fx_fee_match:
-                            fx_fee = float(fx_fee_match.group(1))
-                            i += 1
-                            continue
-
-                        # If we hit something that doesn't match, might be next transaction
-                        if len(next_line) > 5 and not next_line.startswith("Ref:"):
-                            break
-
+                    fx_match = "@" in next_line and FX_PATTERN.search(next_line)
+                    if fx_match:
+                        original_amount = float(fx_match.group(1))
+                        original_currency = fx_match.group(2)
+                        exchange_rate = float(fx_match.group(3))
                         i += 1
+                        continue
 
-                    # Determine transaction type: CR suffix = Credit, otherwise Debit
-                    transaction_type = "Credit" if is_credit else "Debit"
-                    # Amount is always in EUR after conversion; currency field should always be EUR
-                    # Original currency info is stored separately in original_currency field
-                    currency = "EUR"
-
-                    transaction = Transaction(
-                        amount=abs(amount),
-                        currency=currency,
-                        transaction_type=transaction_type,
-                        details=details,
-                        transaction_date=transaction_date,
-                        reference=reference,
-                        posting_date=posting_date,
-                        original_currency=original_currency,
-                        original_amount=original_amount,
-                        exchange_rate=exchange_rate,
-                        fx_fee=fx_fee,
+                    fx_fee_match = (
+                        "Conversion Fee" in next_line
+                        and FX_FEE_PATTERN.search(next_line)
                     )
-                    transactions.append(transaction)
-                else:
-                    i += 1
+                    if fx_fee_match:
+                        fx_fee = float(fx_fee_match.group(1))
+                        i += 1
+                        continue
 
-        except Exception as e:
-            # Log error but return partial results if any
-            logger.error(
-                f"Error extracting transactions from {pdf_path.name}: {e}",
-                exc_info=True,
-            )
+                    # If we hit something that doesn't match, might be next transaction
+                    if len(next_line) > 5 and not next_line.startswith("Ref:"):
+                        break
 
-        return transactions
+                    i += 1
+
+                # Determine transaction type: CR suffix = Credit, otherwise Debit
+                transaction_type = "Credit" if is_credit else "Debit"
+                # Amount is always in EUR after conversion; currency field should always be EUR
+                # Original currency info is stored separately in original_currency field
+                currency = "EUR"
+
+                transaction = Transaction(
+                    amount=abs(amount),
+                    currency=currency,
+                    transaction_type=transaction_type,
+                    details=details,
+                    transaction_date=transaction_date,
+                    reference=reference,
+                    posting_date=posting_date,
+                    original_currency=original_currency,
+                    original_amount=original_amount,
+                    exchange_rate=exchange_rate,
+                    fx_fee=fx_fee,
+                )
+                yield transaction
+            else:
+                i += 1
 
 
 # Auto-register parser instance
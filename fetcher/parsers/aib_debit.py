@@ -1,23 +1,20 @@
 """Parser for AIB debit account statements."""
 
 import logging
+import os
 import re
+from collections import defaultdict
+from dataclasses import replace
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
+from typing import NamedTuple
 
-from pypdf import PdfReader
-import pdfplumber
+from models import Transaction
 
-logger = logging.getLogger(__name__)
-
-# Import Transaction model - handle both relative and absolute imports
-try:
-    from models import Transaction
-except ImportError:
-    import sys
-    from pathlib import Path
+from .pdf_text import PdfReader
 
-    sys.path.insert(0, str(Path(__file__).parent.parent))
-    from models import Transaction
+logger = logging.getLogger(__name__)
 
 
 # Constants for transaction parsing
@@ -28,8 +25,137 @@ MAX_LOOKAHEAD_LINES = 15
 MAX_DETAILS_LENGTH = 100
 HEADER_TOLERANCE_Y = 5
 
-# Regex pattern for matching transaction amounts (integers or decimals with 1-2 decimal places)
-AMOUNT_PATTERN = re.compile(r"^\d+(?:\.\d{1,2})?$")
+# Regex patterns for statement date extraction; page text is whitespace-normalized
+# first, so single literal spaces stand in for \s+
+STATEMENT_DATE_PATTERN = re.compile(r"Date of Statement (\d{1,2} \w{3} \d{4})")
+BALANCE_FORWARD_PATTERN = re.compile(r"(\d{1,2} \w{3} \d{4}) BALANCE FORWARD")
+# Any date, for the first-transaction fallback; matched on the raw page text
+# so that its surrounding context window is the same as the page layout's
+FALLBACK_DATE_PATTERN = re.compile(r"\d{1,2}\s+\w{3}\s+\d{4}")
+
+# Regex patterns for transaction lines, compiled once rather than looked up in
+# re's cache for every line
+TRANSACTION_DATE_PATTERN = re.compile(r"^(\d{1,2}\s+\w{3}\s+\d{4})")
+REFERENCE_PATTERN = re.compile(r"(IE\d{12,})")
+FX_PATTERN = re.compile(r"(\d+\.?\d*)\s+([A-Z]{3})@\s*(\d+\.?\d+)?")
+FX_FEE_PATTERN = re.compile(r"INCL FX FEE\s+[E€]?(\d+\.?\d+)")
+# A line holding only a number, e.g. a balance carried onto its own line
+NUMBER_LINE_PATTERN = re.compile(r"^\d+\.?\d+$")
+# Numbers of five or more digits, which look like balances rather than details
+BIG_NUMBER_PATTERN = re.compile(r"\b\d{5,}\.?\d*\b")
+
+# Footer keywords - stop processing when we encounter these
+FOOTER_KEYWORDS = [
+    "This is an eligible deposit",
+    "Deposit Guarantee Scheme",
+    "Thank you for banking",
+    "Overdrawn balances are marked",
+    "Allied Irish Banks",
+    "Personal Bank Account",
+    "Statement of Account",
+    "Branch",
+    "National Sort Code",
+    "Telephone",
+    "Page Number",
+    "Account Name",
+    "Account Number",
+    "Date of Statement",
+    "IBAN:",
+    "Authorised Limit",
+    "Date Details Debit",
+    "www.aib.ie",
+    "standardconditions",
+    "ForImportantInformation",
+    "For Important Information",
+    "YourAuthorisedLimit",
+    "Your Authorised Limit",
+]
+# All footer keywords as one alternation, so a line is scanned once instead of
+# once per keyword
+FOOTER_PATTERN = re.compile("|".join(map(re.escape, FOOTER_KEYWORDS)))
+# Words never contain whitespace, so only single-token keywords can match one
+FOOTER_WORD_PATTERN = re.compile(
+    "|".join(re.escape(keyword) for keyword in FOOTER_KEYWORDS if " " not in keyword)
+)
+
+
+class _LineWord(NamedTuple):
+    """A word on a transaction line, with its horizontal position."""
+
+    x0: float
+    x1: float
+    x_center: float
+    text: str
+
+
+def _first_transaction_date(page_text: str) -> str | None:
+    """
+    Find the first date on a raw page that isn't part of the statement header.
+
+    Dates near "Date of Statement", or near the column headings without the
+    Debit column, belong to the header rather than a transaction.
+
+    Returns:
+        The date with whitespace normalized, or None if the page has none
+    """
+    for match in FALLBACK_DATE_PATTERN.finditer(page_text):
+        line_context = page_text[max(0, match.start() - 50) : match.end() + 150]
+
+        if "Date of Statement" in line_context:
+            continue
+        if "Date Details" in line_context and "Debit" not in line_context:
+            continue
+
+        return " ".join(match.group().split())
+    return None
+
+
+def _is_amount(text: str) -> bool:
+    """
+    Whether text is a transaction amount: an integer or a decimal with 1-2
+    decimal places, with no sign or thousands separators.
+
+    Every word of every line is checked, so this uses string methods rather
+    than a regex match.
+    """
+    whole, dot, fraction = text.partition(".")
+    if not whole.isdecimal():
+        return False
+    return not dot or (0 < len(fraction) <= 2 and fraction.isdecimal())
+
+
+def _file_key(pdf_path: Path) -> tuple[str, int, int] | None:
+    """
+    Identify a PDF file by path, modification time and size.
+
+    Returns:
+        Tuple of (path, mtime_ns, size), or None if the file can't be stat'ed
+    """
+    try:
+        stat = os.stat(pdf_path)
+    except OSError:
+        return None
+    return str(pdf_path), stat.st_mtime_ns, stat.st_size
+
+
+@lru_cache(maxsize=128)
+def _cached_dates(path: str, mtime_ns: int, size: int) -> tuple[str, str] | None:
+    """
+    Read a PDF's statement dates, once per version of the file.
+
+    Parsing the same unchanged PDF again within a run (e.g. when both the
+    date and the transaction analyses read it) reuses the earlier result;
+    the key changes whenever the file does.
+    """
+    return AIBDebitParser()._read_dates(Path(path))
+
+
+@lru_cache(maxsize=128)
+def _cached_transactions(
+    path: str, mtime_ns: int, size: int
+) -> tuple[Transaction, ...]:
+    """Read a PDF's transactions, once per version of the file."""
+    return tuple(AIBDebitParser()._read_transactions(Path(path)))
 
 
 class AIBDebitParser:
@@ -49,6 +175,36 @@ class AIBDebitParser:
         """
         Extract start and end dates from an AIB debit account statement.
 
+        Results are cached per file path, modification time and size.
+
+        Returns:
+            Tuple of (start_date, end_date) as strings in 'DD MMM YYYY' format,
+            or None if dates cannot be extracted.
+        """
+        file_key = _file_key(pdf_path)
+        if file_key is None:
+            return self._read_dates(pdf_path)
+        return _cached_dates(*file_key)
+
+    def extract_transactions(self, pdf_path: Path) -> list[Transaction]:
+        """
+        Extract transaction records from an AIB debit account statement.
+
+        Results are cached per file path, modification time and size; each
+        call gets its own copies, so callers may modify them freely.
+
+        Returns:
+            List of Transaction objects
+        """
+        file_key = _file_key(pdf_path)
+        if file_key is None:
+            return self._read_transactions(pdf_path)
+        return [replace(tx) for tx in _cached_transactions(*file_key)]
+
+    def _read_dates(self, pdf_path: Path) -> tuple[str, str] | None:
+        """
+        Read start and end dates from the PDF.
+
         Uses a two-strategy approach:
         1. Primary: Look for "BALANCE FORWARD" date (true statement start)
         2. Fallback: Look for first transaction date
@@ -57,19 +213,32 @@ class AIBDebitParser:
             Tuple of (start_date, end_date) as strings in 'DD MMM YYYY' format,
             or None if dates cannot be extracted.
         """
+        reader = None
         try:
             reader = PdfReader(pdf_path)
+            pages = reader.pages
+
+            # Each page is extracted and whitespace-normalized at most once; the
+            # end date is normally on the last page and the start date on the
+            # first, so a typical statement only decodes those two pages
+            page_texts = {}
+
+            def page_text_at(index):
+                """Return a page's (raw, whitespace-normalized) text."""
+                if index not in page_texts:
+                    raw_text = pages[index].extract_text() or ""
+                    page_texts[index] = (raw_text, " ".join(raw_text.split()))
+                return page_texts[index]
 
             # Extract end date from last non-empty page
             end_date = None
-            for page in reversed(reader.pages):
-                page_text = page.extract_text()
-                if not page_text or len(page_text.strip()) < 50:
+            for index in reversed(range(len(pages))):
+                raw_text, page_text = page_text_at(index)
+                # Plain substring checks reject pages far faster than a regex scan
+                if len(raw_text.strip()) < 50 or "Date of Statement" not in page_text:
                     continue
 
-                statement_date_match = re.search(
-                    r"Date of Statement\s+(\d{1,2}\s+\w{3}\s+\d{4})", page_text
-                )
+                statement_date_match = STATEMENT_DATE_PATTERN.search(page_text)
 
                 if statement_date_match:
                     end_date = statement_date_match.group(1)
@@ -78,51 +247,29 @@ class AIBDebitParser:
             if not end_date:
                 return None
 
-            # Extract start date using two-strategy approach
+            # Extract start date in a single forward pass:
+            # 1. Primary: the first BALANCE FORWARD date on any page
+            # 2. Fallback: the first transaction date, kept until a
+            #    BALANCE FORWARD turns up or the pages run out
             start_date = None
+            fallback_date = None
 
-            # STRATEGY 1: Look for BALANCE FORWARD date (primary method)
-            balance_forward_pattern = r"(\d{1,2}\s+\w{3}\s+\d{4})\s+BALANCE FORWARD"
-
-            for page in reader.pages:
-                page_text = page.extract_text()
+            for index in range(len(pages)):
+                raw_text, page_text = page_text_at(index)
                 if not page_text:
                     continue
 
-                balance_forward_match = re.search(balance_forward_pattern, page_text)
-                if balance_forward_match:
-                    start_date = balance_forward_match.group(1)
-                    break
-
-            # STRATEGY 2: Fallback to first transaction date
-            if not start_date:
-                date_pattern = r"(\d{1,2}\s+\w{3}\s+\d{4})"
-
-                for page in reader.pages:
-                    page_text = page.extract_text()
-                    if not page_text:
-                        continue
-
-                    matches = re.finditer(date_pattern, page_text)
-                    for match in matches:
-                        candidate_date = match.group(1)
-                        line_context = page_text[
-                            max(0, match.start() - 50) : match.end() + 150
-                        ]
-
-                        if "Date of Statement" in line_context:
-                            continue
-                        if (
-                            "Date Details" in line_context
-                            and "Debit" not in line_context
-                        ):
-                            continue
-
-                        start_date = candidate_date
+                if "BALANCE FORWARD" in page_text:
+                    balance_forward_match = BALANCE_FORWARD_PATTERN.search(page_text)
+                    if balance_forward_match:
+                        start_date = balance_forward_match.group(1)
                         break
 
-                    if start_date:
-                        break
+                if not fallback_date:
+                    fallback_date = _first_transaction_date(raw_text)
+
+            if not start_date:
+                start_date = fallback_date
 
             # Last resort: use end date as start date
             if not start_date:
@@ -135,10 +282,14 @@ class AIBDebitParser:
                 f"Error extracting dates from {pdf_path.name}: {e}", exc_info=True
             )
             return None
+        finally:
+            # Free MuPDF's C-side document memory right away
+            if reader is not None:
+                reader.close()
 
-    def extract_transactions(self, pdf_path: Path) -> list[Transaction]:
+    def _read_transactions(self, pdf_path: Path) -> list[Transaction]:
         """
-        Extract transaction records from an AIB debit account statement.
+        Read transaction records from the PDF.
 
         Uses column-based detection: determines debit/credit by which column
         the amount appears in, not by keywords.
@@ -148,16 +299,20 @@ class AIBDebitParser:
         """
         transactions = []
         try:
-            # Use pdfplumber to extract words with positions
-            with pdfplumber.open(pdf_path) as pdf:
-                # Step 1: Identify column boundaries from header
-                column_bounds = self._identify_columns(pdf)
-                if not column_bounds:
-                    # Column detection failed - cannot extract transactions
-                    return []
-
-                # Step 2: Extract transactions using column positions
-                transactions = self._extract_transactions_by_columns(pdf, column_bounds)
+            # Extract words with positions, once per page for both steps
+            with PdfReader(pdf_path) as pdf:
+                pages_words = [page.extract_words() for page in pdf.pages]
+
+            # Step 1: Identify column boundaries from header
+            column_bounds = self._identify_columns(pages_words)
+            if not column_bounds:
+                # Column detection failed - cannot extract transactions
+                return []
+
+            # Step 2: Extract transactions using column positions
+            transactions = self._extract_transactions_by_columns(
+                pages_words, column_bounds
+            )
 
         except Exception as e:
             # Log error but return empty list rather than crashing
@@ -169,16 +324,17 @@ class AIBDebitParser:
 
         return transactions
 
-    def _identify_columns(self, pdf) -> dict | None:
+    def _identify_columns(self, pages_words: list[list[dict]]) -> dict | None:
         """
         Identify column boundaries by finding the header row.
 
+        Args:
+            pages_words: Positioned words of each page, from extract_words()
+
         Returns:
             Dictionary with column x-coordinate ranges, or None if not found
         """
-        for page in pdf.pages:
-            words = page.extract_words()
-
+        for words in pages_words:
             # Find header row - look for "Debit" and "Credit" keywords
             debit_header = None
             credit_header = None
@@ -234,14 +390,14 @@ class AIBDebitParser:
             return None
 
         # Try single word match first
-        text = line_words[0]["text"]
+        text = line_words[0].text
         date_match = date_pattern.match(text)
         if date_match:
             return date_match.group(1)
 
         # Try combining first 3 words (for "15 Sep 2025")
         if len(line_words) >= 3:
-            combined = f"{line_words[0]['text']} {line_words[1]['text']} {line_words[2]['text']}"
+            combined = f"{line_words[0].text} {line_words[1].text} {line_words[2].text}"
             date_match = date_pattern.match(combined)
             if date_match:
                 return date_match.group(1)
@@ -251,7 +407,7 @@ class AIBDebitParser:
     def _process_opening_balance_line(
         self,
         line_words: list,
-        line_text: str,
+        line_text_upper: str,
         balance_range: tuple,
         date_pattern: re.Pattern,
     ) -> tuple[dict | None, str | None]:
@@ -267,10 +423,10 @@ class AIBDebitParser:
         # Extract balance from balance column
         opening_balance = None
         for word in line_words:
-            x_center = (word.get("x0", 0) + word.get("x1", 0)) / 2
+            x_center = word.x_center
             if balance_range[0] <= x_center <= balance_range[1]:
                 try:
-                    opening_balance = float(word["text"].replace(",", ""))
+                    opening_balance = float(word.text.replace(",", ""))
                 except ValueError:
                     pass
 
@@ -281,9 +437,7 @@ class AIBDebitParser:
             "amount": 0.0,
             "balance": opening_balance,
             "details": (
-                "OPENING BALANCE"
-                if "OPENING" in line_text.upper()
-                else "BALANCE FORWARD"
+                "OPENING BALANCE" if "OPENING" in line_text_upper else "BALANCE FORWARD"
             ),
             "date": extracted_date,
         }, extracted_date
@@ -306,11 +460,24 @@ class AIBDebitParser:
         reference_value = None
 
         for word in line_words:
-            text = word["text"].replace(",", "")
-            x_center = (word.get("x0", 0) + word.get("x1", 0)) / 2
-
-            # Check for balance in balance column
-            if balance_range[0] <= x_center <= balance_range[1]:
+            text = word.text
+            if "," in text:
+                text = text.replace(",", "")
+
+            # Check for reference; a reference is never a balance or amount
+            if text.startswith("IE"):
+                if len(text) > 10:
+                    reference_value = text
+                continue
+
+            x_center = word.x_center
+
+            # Check for balance in balance column; only text starting with a
+            # digit, "." or "+" can parse to a positive finite balance, so
+            # other words skip the failing float() and its exception
+            if balance_range[0] <= x_center <= balance_range[1] and (
+                text[:1].isdigit() or text[:1] in ".+"
+            ):
                 try:
                     val = float(text)
                     if MIN_BALANCE_VALUE < val < MAX_TRANSACTION_AMOUNT:
@@ -318,57 +485,51 @@ class AIBDebitParser:
                 except ValueError:
                     pass
 
-            # Check for reference
-            if text.startswith("IE") and len(text) > 10:
-                reference_value = text
-
-            # Check for transaction amount
-            if AMOUNT_PATTERN.match(text):
-                try:
-                    amount = float(text)
-                    if MIN_TRANSACTION_AMOUNT <= amount <= MAX_TRANSACTION_AMOUNT:
-                        if debit_range[0] <= x_center <= debit_range[1]:
-                            tx_amounts.append(("debit", amount, word))
-                        elif credit_range[0] <= x_center <= credit_range[1]:
-                            tx_amounts.append(("credit", amount, word))
-                except ValueError:
-                    pass
+            # Check for transaction amount; description words fail the first
+            # character check without calling _is_amount(), and float() can't
+            # fail on text that passes it
+            if text[:1].isdecimal() and _is_amount(text):
+                amount = float(text)
+                if MIN_TRANSACTION_AMOUNT <= amount <= MAX_TRANSACTION_AMOUNT:
+                    if debit_range[0] <= x_center <= debit_range[1]:
+                        tx_amounts.append(("debit", amount, word))
+                    elif credit_range[0] <= x_center <= credit_range[1]:
+                        tx_amounts.append(("credit", amount, word))
 
         return tx_amounts, balance_value, reference_value
 
     def _collect_transaction_details(
         self,
         line_words: list,
-        amount_word: dict,
+        amount_word: _LineWord,
         current_date: str,
         date_pattern: re.Pattern,
         debit_range: tuple,
     ) -> str:
         """Collect transaction description from words before the amount."""
         details_max_x = debit_range[0]  # Details column ends before debit column
+        # Day number, month and year, which are excluded from the details
+        date_parts = current_date.split()
 
         desc_words = [
             w
             for w in line_words
-            if w.get("x0", 0) < amount_word.get("x0", 0)
-            and w.get("x0", 0) < details_max_x
-            and not date_pattern.match(w["text"])
-            and w["text"] != current_date.split()[0]  # Exclude day number
-            and w["text"] != current_date.split()[1]  # Exclude month
-            and w["text"] != current_date.split()[2]  # Exclude year
+            if w.x0 < amount_word.x0 and w.x0 < details_max_x
+            # Only words starting with a digit can start a date
+            and not (w.text[:1].isdigit() and date_pattern.match(w.text))
+            and w.text not in date_parts
         ]
-        return " ".join(w["text"] for w in desc_words).strip()
+        return " ".join(w.text for w in desc_words).strip()
 
     def _collect_additional_info_from_lines(
         self,
         start_idx: int,
         sorted_y: list,
         lines: dict,
+        line_texts: dict,
+        line_amounts: dict,
         date_pattern: re.Pattern,
-        debit_range: tuple,
-        credit_range: tuple,
         balance_range: tuple,
-        footer_keywords: list,
         details_max_x: float,
         initial_reference: str | None,
         initial_balance: float | None,
@@ -390,47 +551,31 @@ class AIBDebitParser:
             start_idx + 1, min(start_idx + MAX_LOOKAHEAD_LINES, len(sorted_y))
         ):
             next_y = sorted_y[j]
-            next_line_words = sorted(lines[next_y], key=lambda w: w.get("x0", 0))
-            next_line_text = " ".join(w["text"] for w in next_line_words)
+            next_line_words = lines[next_y]
+            next_line_text = line_texts[next_y]
 
             # Stop if we hit another date
-            if next_line_words and date_pattern.match(next_line_words[0]["text"]):
+            if next_line_words and date_pattern.match(next_line_words[0].text):
                 break
 
             # Stop if we hit another transaction amount
-            has_another_tx = False
-            for word in next_line_words:
-                text = word["text"].replace(",", "")
-                if AMOUNT_PATTERN.match(text):
-                    try:
-                        amt = float(text)
-                        if MIN_TRANSACTION_AMOUNT <= amt <= MAX_TRANSACTION_AMOUNT:
-                            x_center = (word.get("x0", 0) + word.get("x1", 0)) / 2
-                            if (
-                                debit_range[0] <= x_center <= debit_range[1]
-                                or credit_range[0] <= x_center <= credit_range[1]
-                            ):
-                                has_another_tx = True
-                                break
-                    except ValueError:
-                        pass
-
-            if has_another_tx:
+            if line_amounts[next_y][0]:
                 break
 
-            # Collect reference
-            if not result["reference"]:
-                ref_match = re.search(r"(IE\d{12,})", next_line_text)
+            # Collect reference; the substring checks below skip each regex on
+            # the many lines that can't match it
+            if not result["reference"] and "IE" in next_line_text:
+                ref_match = REFERENCE_PATTERN.search(next_line_text)
                 if ref_match:
                     result["reference"] = ref_match.group(1)
 
             # Collect balance
             if not result["balance"]:
                 for word in next_line_words:
-                    x_center = (word.get("x0", 0) + word.get("x1", 0)) / 2
+                    x_center = word.x_center
                     if balance_range[0] <= x_center <= balance_range[1]:
                         try:
-                            val = float(word["text"].replace(",", ""))
+                            val = float(word.text.replace(",", ""))
                             if val > MIN_BALANCE_VALUE:
                                 result["balance"] = val
                                 break
@@ -438,10 +583,8 @@ class AIBDebitParser:
                             pass
 
             # Collect FX info
-            if "original_currency" not in result["fx_info"]:
-                fx_match = re.search(
-                    r"(\d+\.?\d*)\s+([A-Z]{3})@\s*(\d+\.?\d+)?", next_line_text
-                )
+            if "original_currency" not in result["fx_info"] and "@" in next_line_text:
+                fx_match = FX_PATTERN.search(next_line_text)
                 if fx_match:
                     result["fx_info"]["original_amount"] = float(fx_match.group(1))
                     result["fx_info"]["original_currency"] = fx_match.group(2)
@@ -458,10 +601,8 @@ class AIBDebitParser:
                         ] += f" {fx_match.group(1)} {fx_match.group(2)}@"
 
             # Collect FX fee
-            if "fx_fee" not in result["fx_info"]:
-                fx_fee_match = re.search(
-                    r"INCL FX FEE\s+[E€]?(\d+\.?\d+)", next_line_text
-                )
+            if "fx_fee" not in result["fx_info"] and "INCL FX FEE" in next_line_text:
+                fx_fee_match = FX_FEE_PATTERN.search(next_line_text)
                 if fx_fee_match:
                     result["fx_info"]["fx_fee"] = float(fx_fee_match.group(1))
                     result[
@@ -469,23 +610,21 @@ class AIBDebitParser:
                     ] += " INCL FX FEE E" + fx_fee_match.group(1)
 
             # Check for footer - stop immediately
-            if any(kw in next_line_text for kw in footer_keywords):
+            if FOOTER_PATTERN.search(next_line_text):
                 break
 
             # Additional description (but skip numbers and duplicates)
-            if not re.match(r"^\d+\.?\d+$", next_line_text.strip()):
+            if not NUMBER_LINE_PATTERN.match(next_line_text.strip()):
                 # Skip if it looks like a balance
-                if re.search(r"\b\d{5,}\.?\d*\b", next_line_text):
+                if BIG_NUMBER_PATTERN.search(next_line_text):
                     continue
 
                 # Filter out words beyond details column
-                details_words = [
-                    w for w in next_line_words if w.get("x0", 0) < details_max_x
-                ]
+                details_words = [w for w in next_line_words if w.x0 < details_max_x]
                 if not details_words:
                     continue
 
-                clean_text = " ".join(w["text"] for w in details_words).strip()
+                clean_text = " ".join(w.text for w in details_words).strip()
 
                 # Avoid duplicates and very long lines
                 if clean_text and len(clean_text) < MAX_DETAILS_LENGTH:
@@ -495,7 +634,7 @@ class AIBDebitParser:
         return result
 
     def _extract_transactions_by_columns(
-        self, pdf, column_bounds: dict
+        self, pages_words: list[list[dict]], column_bounds: dict
     ) -> list[Transaction]:
         """
         Extract transactions using column position detection.
@@ -504,63 +643,51 @@ class AIBDebitParser:
         the amount appears in.
         """
         transactions = []
-        date_pattern = re.compile(r"^(\d{1,2}\s+\w{3}\s+\d{4})")
+        date_pattern = TRANSACTION_DATE_PATTERN
 
         debit_range = column_bounds["debit"]
         credit_range = column_bounds["credit"]
         balance_range = column_bounds["balance"]
         header_y = column_bounds["header_y"]
 
-        # Footer keywords - stop processing when we encounter these
-        footer_keywords = [
-            "This is an eligible deposit",
-            "Deposit Guarantee Scheme",
-            "Thank you for banking",
-            "Overdrawn balances are marked",
-            "Allied Irish Banks",
-            "Personal Bank Account",
-            "Statement of Account",
-            "Branch",
-            "National Sort Code",
-            "Telephone",
-            "Page Number",
-            "Account Name",
-            "Account Number",
-            "Date of Statement",
-            "IBAN:",
-            "Authorised Limit",
-            "Date Details Debit",
-            "www.aib.ie",
-            "standardconditions",
-            "ForImportantInformation",
-            "For Important Information",
-            "YourAuthorisedLimit",
-            "Your Authorised Limit",
-        ]
-
         prev_balance = None
         opening_balance_tx = (
             None  # Store opening balance transaction to insert at start
         )
 
         # Process each page
-        for page in pdf.pages:
-            words = page.extract_words()
-
-            # Group words by line (y-coordinate)
-            lines = {}
-            for word in words:
+        for words in pages_words:
+            # Group words by line (y-coordinate); taking the page's words left
+            # to right leaves every line in order without sorting each one
+            lines = defaultdict(list)
+            for word in sorted(words, key=itemgetter("x0")):
+                top = word["top"]
+                text = word["text"]
                 # Skip header
-                if abs(word.get("top", 0) - header_y) < HEADER_TOLERANCE_Y:
+                if abs(top - header_y) < HEADER_TOLERANCE_Y:
                     continue
                 # Skip footer
-                if any(kw in word["text"] for kw in footer_keywords):
+                if FOOTER_WORD_PATTERN.search(text):
                     continue
 
-                y_key = round(word.get("top", 0))
-                if y_key not in lines:
-                    lines[y_key] = []
-                lines[y_key].append(word)
+                x0 = word["x0"]
+                x1 = word["x1"]
+                lines[round(top)].append(_LineWord(x0, x1, (x0 + x1) / 2, text))
+
+            # Join each line's text once; a line can be looked ahead to
+            # from several transactions above it
+            line_texts = {
+                y_pos: " ".join(w.text for w in line_words)
+                for y_pos, line_words in lines.items()
+            }
+            # Classify each line's words once as well; the look-ahead of every
+            # transaction above a line needs to know whether it holds an amount
+            line_amounts = {
+                y_pos: self._find_transaction_amounts(
+                    line_words, debit_range, credit_range, balance_range
+                )
+                for y_pos, line_words in lines.items()
+            }
 
             # Process lines in order
             sorted_y = sorted(lines.keys())
@@ -569,16 +696,16 @@ class AIBDebitParser:
 
             while i < len(sorted_y):
                 y_pos = sorted_y[i]
-                line_words = sorted(lines[y_pos], key=lambda w: w.get("x0", 0))
+                line_words = lines[y_pos]
 
                 # Check for BALANCE FORWARD and OPENING BALANCE
-                line_text = " ".join(w["text"] for w in line_words)
+                line_text_upper = line_texts[y_pos].upper()
                 if (
-                    "BALANCE FORWARD" in line_text.upper()
-                    or "OPENING BALANCE" in line_text.upper()
+                    "BALANCE FORWARD" in line_text_upper
+                    or "OPENING BALANCE" in line_text_upper
                 ):
                     balance_tx, extracted_date = self._process_opening_balance_line(
-                        line_words, line_text, balance_range, date_pattern
+                        line_words, line_text_upper, balance_range, date_pattern
                     )
                     if balance_tx and opening_balance_tx is None:
                         opening_balance_tx = balance_tx
@@ -600,11 +727,7 @@ class AIBDebitParser:
                     continue
 
                 # Find transaction amounts on this line
-                tx_amounts, balance_value, reference_value = (
-                    self._find_transaction_amounts(
-                        line_words, debit_range, credit_range, balance_range
-                    )
-                )
+                tx_amounts, balance_value, reference_value = line_amounts[y_pos]
 
                 # Process each transaction amount found on this line
                 for tx_type, amount, amount_word in tx_amounts:
@@ -619,11 +742,10 @@ class AIBDebitParser:
                         i,
                         sorted_y,
                         lines,
+                        line_texts,
+                        line_amounts,
                         date_pattern,
-                        debit_range,
-                        credit_range,
                         balance_range,
-                        footer_keywords,
                         details_max_x,
                         reference_value,
                         balance_value,
@@ -0,0 +1,57 @@
+"""Statement parsing across many PDF files."""
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from .registry import detect_parsers
+
+
+def parse_pdf(pdf_path: Path) -> tuple[str, tuple[str, str], list] | None:
+    """
+    Detect a PDF statement's parser and extract its dates and transactions.
+
+    Parsers that recognize the PDF are tried in registration order until one
+    extracts the dates, as parse_statement() does. Parsers that provide
+    parse() read the PDF text once for both; others are asked for dates and
+    transactions separately.
+
+    Args:
+        pdf_path: Path to the PDF file
+
+    Returns:
+        Tuple of (parser_name, (start_date, end_date), transactions), or None
+        if no parser recognizes the PDF or extracts its dates
+    """
+    for parser in detect_parsers(pdf_path):
+        if hasattr(parser, "parse"):
+            dates, transactions = parser.parse(pdf_path)
+        else:
+            dates = parser.extract_dates(pdf_path)
+            transactions = parser.extract_transactions(pdf_path) if dates else []
+
+        if dates:
+            return parser.name, dates, transactions
+
+    return None
+
+
+def parse_many(
+    pdf_paths: list[Path], max_workers: int = 1
+) -> list[tuple[str, tuple[str, str], list] | None]:
+    """
+    Parse many PDF statements, optionally in parallel.
+
+    Each file is parsed independently and parsing is CPU-bound, so with
+    max_workers > 1 files are spread across worker processes.
+
+    Args:
+        pdf_paths: Paths to the PDF files
+        max_workers: Number of worker processes (1 parses in the current process)
+
+    Returns:
+        parse_pdf() results, in the same order as pdf_paths
+    """
+    if max_workers > 1 and len(pdf_paths) > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(parse_pdf, pdf_paths))
+    return [parse_pdf(pdf_path) for pdf_path in pdf_paths]
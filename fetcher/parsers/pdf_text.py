@@ -0,0 +1,119 @@
+"""PDF text extraction backed by PyMuPDF.
+
+Exposes the small subset of pypdf's ``PdfReader`` interface that the parsers
+use (``reader.pages[i].extract_text()``), plus pdfplumber-style positioned
+words (``page.extract_words()``), so parsers can switch to the much faster
+MuPDF engine without changing their parsing logic.
+"""
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pymupdf
+
+# Words whose bottom edges differ by at most this many points share a line
+LINE_TOLERANCE_Y = 3
+
+
+class PdfPage:
+    """A single page of a PdfReader."""
+
+    def __init__(self, page: "pymupdf.Page"):
+        self._page = page
+
+    def extract_text(self) -> str:
+        """
+        Extract the page text, one visual row per line.
+
+        Words are grouped into rows by their vertical position and joined
+        left to right, which matches pypdf's layout for tabular statements
+        (MuPDF's own "text" mode splits table columns into separate blocks).
+        """
+        words = self._page.get_text("words")
+        if not words:
+            return ""
+
+        # Each word is (x0, y0, x1, y1, text, block_no, line_no, word_no)
+        words.sort(key=lambda word: (word[3], word[0]))
+        rows = []
+        current_row = [words[0]]
+        row_bottom = words[0][3]
+        for word in words[1:]:
+            if word[3] - row_bottom > LINE_TOLERANCE_Y:
+                rows.append(current_row)
+                current_row = []
+                row_bottom = word[3]
+            current_row.append(word)
+        rows.append(current_row)
+
+        return "\n".join(
+            " ".join(word[4] for word in sorted(row, key=lambda word: word[0]))
+            for row in rows
+        )
+
+    def extract_words(self) -> list[dict]:
+        """
+        Extract words with their positions, in pdfplumber's format.
+
+        Returns:
+            List of word dicts with "text", "x0", "x1", "top" and "bottom" keys,
+            coordinates in points from the top-left corner of the page
+        """
+        return [
+            {"text": text, "x0": x0, "x1": x1, "top": top, "bottom": bottom}
+            for x0, top, x1, bottom, text, *_ in self._page.get_text("words", sort=True)
+        ]
+
+
+class _Pages:
+    """Lazy, indexable sequence of pages; pages are loaded on access."""
+
+    def __init__(self, document: "pymupdf.Document"):
+        self._document = document
+
+    def __len__(self) -> int:
+        return self._document.page_count
+
+    def __getitem__(self, index: int) -> PdfPage:
+        page_count = len(self)
+        if index < 0:
+            index += page_count
+        if not 0 <= index < page_count:
+            raise IndexError("page index out of range")
+        return PdfPage(self._document.load_page(index))
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __reversed__(self):
+        for index in reversed(range(len(self))):
+            yield self[index]
+
+
+class PdfReader:
+    """
+    pypdf-compatible reader for a PDF file.
+
+    The underlying MuPDF document holds C-allocated memory, so call close()
+    (or use the reader as a context manager) once done with it.
+    """
+
+    def __init__(self, pdf_path: Path | str):
+        # Imported on first use: loading MuPDF takes a noticeable part of
+        # startup, and callers that only route or list files never open a PDF
+        import pymupdf
+
+        self._document = pymupdf.open(pdf_path)
+        self.pages = _Pages(self._document)
+
+    def close(self) -> None:
+        """Release the underlying MuPDF document."""
+        self._document.close()
+
+    def __enter__(self) -> "PdfReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
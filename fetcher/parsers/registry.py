@@ -1,11 +1,10 @@
 """Parser registry with auto-detection."""
 
 from pathlib import Path
-from typing import Optional
-
-from pypdf import PdfReader
+from typing import Iterator, Optional
 
 from .base import StatementParser
+from .pdf_text import PdfReader
 
 _registered_parsers: list[StatementParser] = []
 
@@ -20,31 +19,94 @@ def get_registered_parsers() -> list[StatementParser]:
     return _registered_parsers.copy()
 
 
+def _matching_parsers(reader: PdfReader) -> Iterator[StatementParser]:
+    """
+    Yield the registered parsers that recognize an open PDF, in registration order.
+
+    Only the first page's text is used; nothing is yielded for a PDF without
+    pages or without text on its first page.
+    """
+    if not reader.pages:
+        return
+
+    first_page_text = reader.pages[0].extract_text()
+    if not first_page_text:
+        return
+
+    for parser in _registered_parsers:
+        if parser.can_parse(first_page_text):
+            yield parser
+
+
+def detect_parsers(pdf_path: Path) -> list[StatementParser]:
+    """
+    Find all registered parsers that recognize a PDF statement.
+
+    Unlike parse_statement(), no dates are extracted, so callers can let a
+    parser read the statement once for everything they need, moving on to
+    the next one if it can't.
+
+    Args:
+        pdf_path: Path to the PDF file
+
+    Returns:
+        The matching parsers in registration order, empty if none match
+    """
+    reader = None
+    try:
+        reader = PdfReader(pdf_path)
+        return list(_matching_parsers(reader))
+    except Exception:
+        return []
+    finally:
+        if reader is not None:
+            reader.close()
+
+
+def detect_parser(pdf_path: Path) -> StatementParser | None:
+    """
+    Find the first registered parser that recognizes a PDF statement.
+
+    Args:
+        pdf_path: Path to the PDF file
+
+    Returns:
+        The matching parser, or None if no parser recognizes the PDF
+    """
+    parsers = detect_parsers(pdf_path)
+    return parsers[0] if parsers else None
+
+
 def parse_statement(pdf_path: Path) -> tuple[str, str, str] | None:
     """
     Auto-detect and parse statement dates from PDF.
 
+    Matching parsers are tried in registration order until one extracts
+    the dates.
+
     Args:
         pdf_path: Path to the PDF file
 
     Returns:
         Tuple of (start_date, end_date, parser_name) or None if no parser matches
     """
+    reader = None
     try:
         reader = PdfReader(pdf_path)
-        if not reader.pages:
-            return None
-
-        first_page_text = reader.pages[0].extract_text()
-        if not first_page_text:
-            return None
-
-        for parser in _registered_parsers:
-            if parser.can_parse(first_page_text):
+        for parser in _matching_parsers(reader):
+            # Parsers that can work from an open reader reuse this one
+            # rather than opening and parsing the file again
+            if hasattr(parser, "extract_dates_from_reader"):
+                dates = parser.extract_dates_from_reader(reader)
+            else:
                 dates = parser.extract_dates(pdf_path)
-                if dates:
-                    return (*dates, parser.name)
+            if dates:
+                return (*dates, parser.name)
 
         return None
     except Exception:
         return None
+    finally:
+        # Free MuPDF's C-side document memory right away
+        if reader is not None:
+            reader.close()
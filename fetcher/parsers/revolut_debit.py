@@ -10,10 +10,46 @@ import re
 from pathlib import Path
 from datetime import datetime
 
-from pypdf import PdfReader
+from .pdf_text import PdfReader
 
 logger = logging.getLogger(__name__)
 
+# Month abbreviation to number mapping for date parsing
+MONTH_NUMBERS = {
+    "Jan": 1,
+    "Feb": 2,
+    "Mar": 3,
+    "Apr": 4,
+    "May": 5,
+    "Jun": 6,
+    "Jul": 7,
+    "Aug": 8,
+    "Sep": 9,
+    "Oct": 10,
+    "Nov": 11,
+    "Dec": 12,
+}
+
+# Pattern to match transaction dates: "DD MMM YYYY"
+# Transactions appear as: "DD MMM YYYY - DD MMM YYYY Description" or "DD MMM YYYY Description"
+# We match dates that are followed by either a dash+date or description text.
+# The month alternation is factored by shared prefixes (Jan/Jun/Jul, Mar/May,
+# Apr/Aug), so fewer branches are tried at each candidate position
+TRANSACTION_DATE_PATTERN = re.compile(
+    r"(\d{1,2})\s+(J(?:an|u[nl])|Feb|Ma[ry]|A(?:pr|ug)|Sep|Oct|Nov|Dec)\s+(\d{4})(?:\s+-\s+\d{1,2}\s+\w{3}\s+\d{4})?\s+[A-Z]",
+    re.IGNORECASE,
+)
+
+# Literals HEADER_DATE_PATTERN starts with, checked on casefolded text
+# before running the regex
+HEADER_MARKERS = ("generated on", "statement", "page")
+
+# Dates in headers like "Generated on [the] DD MMM YYYY", "Statement", "Page"
+HEADER_DATE_PATTERN = re.compile(
+    r"(Generated on|Statement|Page)(?:\s+the)?\s+\d{1,2}\s+\w{3}\s+\d{4}",
+    re.IGNORECASE,
+)
+
 
 class RevolutDebitParser:
     """Parser for Revolut debit account statements."""
@@ -45,32 +81,31 @@ class RevolutDebitParser:
         """
         try:
             reader = PdfReader(pdf_path)
+        except Exception:
+            return None
+        try:
+            return self.extract_dates_from_reader(reader)
+        finally:
+            reader.close()
+
+    def extract_dates_from_reader(self, reader: PdfReader) -> tuple[str, str] | None:
+        """
+        Extract start and end dates from an already opened statement.
+
+        Lets the registry reuse the reader it opened for detection instead of
+        parsing the PDF a second time. The caller keeps ownership of the
+        reader and closes it.
+
+        Args:
+            reader: PdfReader of the statement
 
-            # Month abbreviation to number mapping for date parsing
-            month_map = {
-                "Jan": 1,
-                "Feb": 2,
-                "Mar": 3,
-                "Apr": 4,
-                "May": 5,
-                "Jun": 6,
-                "Jul": 7,
-                "Aug": 8,
-                "Sep": 9,
-                "Oct": 10,
-                "Nov": 11,
-                "Dec": 12,
-            }
-
-            # Pattern to match transaction dates: "DD MMM YYYY"
-            # Transactions appear as: "DD MMM YYYY - DD MMM YYYY Description" or "DD MMM YYYY Description"
-            # We match dates that are followed by either a dash+date or description text
-            transaction_date_pattern = re.compile(
-                r"(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{4})(?:\s+-\s+\d{1,2}\s+\w{3}\s+\d{4})?\s+[A-Z]",
-                re.IGNORECASE,
-            )
-
-            all_dates = []
+        Returns:
+            Tuple of (start_date, end_date) as strings in 'DD MMM YYYY' format,
+            or None if dates cannot be extracted.
+        """
+        try:
+            # Earliest and latest (date_tuple, date_str) seen so far
+            first = last = None
 
             for page in reader.pages:
                 page_text = page.extract_text()
@@ -78,7 +113,7 @@ class RevolutDebitParser:
                     continue
 
                 # Find all transaction dates on this page
-                matches = transaction_date_pattern.finditer(page_text)
+                matches = TRANSACTION_DATE_PATTERN.finditer(page_text)
                 for match in matches:
                     # Check if this date is in a header context (should be excluded)
                     match_start = match.start()
@@ -86,11 +121,10 @@ class RevolutDebitParser:
                     context = page_text[context_start : match_start + 20]
 
                     # Skip dates in headers like "Generated on [the] DD MMM YYYY", "Statement", "Page"
-                    if re.search(
-                        r"(Generated on|Statement|Page)(?:\s+the)?\s+\d{1,2}\s+\w{3}\s+\d{4}",
-                        context,
-                        re.IGNORECASE,
-                    ):
+                    context_folded = context.casefold()
+                    if any(
+                        marker in context_folded for marker in HEADER_MARKERS
+                    ) and HEADER_DATE_PATTERN.search(context):
                         continue
 
                     day = int(match.group(1))
@@ -98,23 +132,19 @@ class RevolutDebitParser:
                     year = int(match.group(3))
 
                     # Validate month abbreviation
-                    if month_abbr in month_map:
-                        # Create date tuple for sorting: (year, month, day)
-                        date_tuple = (year, month_map[month_abbr], day)
-                        date_str = f"{day} {month_abbr} {year}"
-                        all_dates.append((date_tuple, date_str))
-
-            if not all_dates:
+                    if month_abbr in MONTH_NUMBERS:
+                        # Create date tuple for comparing: (year, month, day)
+                        date_tuple = (year, MONTH_NUMBERS[month_abbr], day)
+                        if first is None or date_tuple < first[0]:
+                            first = (date_tuple, f"{day} {month_abbr} {year}")
+                        if last is None or date_tuple > last[0]:
+                            last = (date_tuple, f"{day} {month_abbr} {year}")
+
+            if first is None:
                 return None
 
-            # Sort by date tuple (year, month, day)
-            all_dates.sort(key=lambda x: x[0])
-
-            # First transaction is start, last transaction is end
-            start_date = all_dates[0][1]
-            end_date = all_dates[-1][1]
-
-            return (start_date, end_date)
+            # Earliest transaction is start, latest transaction is end
+            return (first[1], last[1])
 
         except Exception:
             return None
@@ -8,6 +8,10 @@ This extractor converts Revolut Excel data to the standard Transaction model.
 """
 
 import logging
+import os
+import re
+import zipfile
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
@@ -36,6 +40,128 @@ STATE_COMPLETED = "COMPLETED"
 # Default product to extract
 DEFAULT_PRODUCT = "Current"
 
+# English month abbreviations indexed by month number, independent of locale
+_MONTH_ABBR = (
+    "",
+    "Jan",
+    "Feb",
+    "Mar",
+    "Apr",
+    "May",
+    "Jun",
+    "Jul",
+    "Aug",
+    "Sep",
+    "Oct",
+    "Nov",
+    "Dec",
+)
+
+# pandas engine for reading .xlsx files; calamine (Rust) parses workbooks
+# several times faster than openpyxl and with far less memory
+EXCEL_ENGINE = "calamine"
+
+# Workbook parts that can hold the header cell text: the shared strings for
+# most writers, inline strings in the sheets for others (lowercased names)
+_SHARED_STRINGS_PART = "xl/sharedstrings.xml"
+_WORKSHEETS_PREFIX = "xl/worksheets/"
+
+# Header row text always present in Revolut exports, and how many bytes of
+# each part to search for it (the header row comes first in both kinds)
+_HEADER_MARKER = COLUMN_COMPLETED_DATE.encode()
+_HEADER_PROBE_BYTES = 4096
+
+# End of a sheet's first row, possibly with a namespace prefix
+_ROW_END_PATTERN = re.compile(rb"</(?:\w+:)?row>")
+
+# Columns the extractor reads; any others in the export are skipped
+STATEMENT_COLUMNS = frozenset(
+    {
+        COLUMN_TYPE,
+        COLUMN_PRODUCT,
+        COLUMN_STARTED_DATE,
+        COLUMN_COMPLETED_DATE,
+        COLUMN_DESCRIPTION,
+        COLUMN_AMOUNT,
+        COLUMN_FEE,
+        COLUMN_CURRENCY,
+        COLUMN_STATE,
+        COLUMN_BALANCE,
+    }
+)
+
+
+def _is_statement_column(column: str) -> bool:
+    """Tell whether a column is one the extractor reads."""
+    return column in STATEMENT_COLUMNS
+
+
+def _may_have_statement_header(file_path: Path) -> bool:
+    """
+    Cheaply rule out workbooks that can't have the Revolut header row.
+
+    Peeks at the start of the parts holding cell text instead of having
+    pandas parse the sheet. Returns False only when every such part was
+    inspected far enough to be sure the header text isn't there: a shared
+    strings part read to its end, a sheet read past its first row. Otherwise
+    returns True, leaving the decision to the full header read.
+    """
+    try:
+        with zipfile.ZipFile(file_path) as workbook:
+            # (name, is_sheet) of every part that can hold cell text
+            parts = []
+            for name in workbook.namelist():
+                lowered = name.lower()
+                if lowered == _SHARED_STRINGS_PART:
+                    parts.append((name, False))
+                elif lowered.startswith(_WORKSHEETS_PREFIX) and lowered.endswith(
+                    ".xml"
+                ):
+                    parts.append((name, True))
+            if not parts:
+                return True
+
+            for name, is_sheet in parts:
+                with workbook.open(name) as part_file:
+                    head = part_file.read(_HEADER_PROBE_BYTES + 1)
+                if _HEADER_MARKER in head:
+                    return True
+                read_completely = len(head) <= _HEADER_PROBE_BYTES
+                if not read_completely and not (
+                    is_sheet and _ROW_END_PATTERN.search(head)
+                ):
+                    return True
+            return False
+    except Exception:
+        # Unreadable, encrypted or not a zip at all
+        return True
+
+
+def _read_statement(file_path: Path) -> pd.DataFrame:
+    """
+    Read a Revolut Excel statement into a DataFrame.
+
+    Extracting dates, transactions and products each need the whole sheet, so
+    the DataFrame of an unchanged file is parsed once and shared; callers must
+    not modify it. Files that can't be stat'ed are read without caching.
+    """
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return _read_excel(file_path)
+    return _read_statement_cached(str(file_path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=8)
+def _read_statement_cached(path: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    """Read a statement once per path, modification time and size."""
+    return _read_excel(path)
+
+
+def _read_excel(path) -> pd.DataFrame:
+    """Read only the statement columns of a workbook."""
+    return pd.read_excel(path, engine=EXCEL_ENGINE, usecols=_is_statement_column)
+
 
 class RevolutExcelTransactionExtractor:
     """Extractor for Revolut Excel account statements."""
@@ -65,9 +191,12 @@ class RevolutExcelTransactionExtractor:
         if not file_path.suffix.lower() == ".xlsx":
             return False
 
+        if not _may_have_statement_header(file_path):
+            return False
+
         try:
             # Read just the header to check columns
-            df = pd.read_excel(file_path, nrows=0)
+            df = pd.read_excel(file_path, engine=EXCEL_ENGINE, nrows=0)
             required_columns = {
                 COLUMN_TYPE,
                 COLUMN_PRODUCT,
@@ -92,7 +221,7 @@ class RevolutExcelTransactionExtractor:
             or None if dates cannot be extracted.
         """
         try:
-            df = pd.read_excel(file_path)
+            df = _read_statement(file_path)
 
             # Filter by product and completed state
             filtered = df[
@@ -132,7 +261,7 @@ class RevolutExcelTransactionExtractor:
             List of Transaction objects, or empty list if extraction fails
         """
         try:
-            df = pd.read_excel(file_path)
+            df = _read_statement(file_path)
 
             # Filter by product and completed state
             filtered = df[
@@ -151,9 +280,32 @@ class RevolutExcelTransactionExtractor:
             # Sort by completed date
             filtered = filtered.sort_values(COLUMN_COMPLETED_DATE)
 
+            # Prepare each column once; building a Series per row with
+            # iterrows() dominated the cost of large exports
+            # Started Date is optional; it is only needed where the
+            # completed date is missing
+            completed_dates = filtered[COLUMN_COMPLETED_DATE]
+            if COLUMN_STARTED_DATE in filtered:
+                dates = completed_dates.where(
+                    completed_dates.notna(), filtered[COLUMN_STARTED_DATE]
+                )
+            else:
+                dates = completed_dates
+            balances = filtered[COLUMN_BALANCE]
+            rows = zip(
+                filtered[COLUMN_AMOUNT].tolist(),
+                filtered[COLUMN_FEE].fillna(0.0).tolist(),
+                dates.tolist(),
+                balances.tolist(),
+                balances.notna().tolist(),
+                filtered[COLUMN_TYPE].fillna("").tolist(),
+                filtered[COLUMN_DESCRIPTION].fillna("").tolist(),
+                filtered[COLUMN_CURRENCY].fillna("EUR").tolist(),
+            )
+
             transactions = []
-            for _, row in filtered.iterrows():
-                tx = self._row_to_transaction(row)
+            for values in rows:
+                tx = self._values_to_transaction(*values)
                 if tx:
                     transactions.append(tx)
 
@@ -174,19 +326,30 @@ class RevolutExcelTransactionExtractor:
             )
             return []
 
-    def _row_to_transaction(self, row: pd.Series) -> Optional[Transaction]:
+    def _values_to_transaction(
+        self,
+        amount,
+        fee,
+        date,
+        balance,
+        has_balance: bool,
+        tx_type,
+        description,
+        currency,
+    ) -> Optional[Transaction]:
         """
-        Convert a DataFrame row to a Transaction object.
+        Convert the cell values of one row to a Transaction object.
 
-        Args:
-            row: pandas Series representing a single transaction row
+        Missing values are expected to be filled in already: fee with 0.0,
+        date with the started date, type and description with "" and
+        currency with "EUR".
 
         Returns:
             Transaction object or None if conversion fails
         """
         try:
-            amount = float(row[COLUMN_AMOUNT])
-            fee = float(row[COLUMN_FEE]) if pd.notna(row[COLUMN_FEE]) else 0.0
+            amount = float(amount)
+            fee = float(fee)
 
             # Determine transaction type from amount sign
             # Positive = Credit (money in), Negative = Debit (money out)
@@ -198,38 +361,18 @@ class RevolutExcelTransactionExtractor:
                 abs_amount = abs(amount)
 
             # Format date as 'DD MMM YYYY'
-            completed_date = row[COLUMN_COMPLETED_DATE]
-            if pd.isna(completed_date):
-                # Fallback to started date if completed is null
-                completed_date = row[COLUMN_STARTED_DATE]
-
-            date_str = self._format_date(completed_date)
-
-            # Get balance (may be null)
-            balance = (
-                float(row[COLUMN_BALANCE]) if pd.notna(row[COLUMN_BALANCE]) else None
-            )
+            date_str = self._format_date(date)
 
             # Build description from type and description
-            tx_type = str(row[COLUMN_TYPE]) if pd.notna(row[COLUMN_TYPE]) else ""
-            description = (
-                str(row[COLUMN_DESCRIPTION])
-                if pd.notna(row[COLUMN_DESCRIPTION])
-                else ""
-            )
             details = f"[{tx_type}] {description}".strip()
 
             return Transaction(
                 amount=abs_amount,
-                currency=(
-                    str(row[COLUMN_CURRENCY])
-                    if pd.notna(row[COLUMN_CURRENCY])
-                    else "EUR"
-                ),
+                currency=str(currency),
                 transaction_type=transaction_type,
                 details=details,
                 transaction_date=date_str,
-                balance=balance,
+                balance=float(balance) if has_balance else None,
                 fee=fee if fee != 0.0 else None,
             )
 
@@ -255,10 +398,7 @@ class RevolutExcelTransactionExtractor:
                 return dt
 
         # Use platform-independent formatting
-        day = dt.day
-        month = dt.strftime("%b")
-        year = dt.year
-        return f"{day} {month} {year}"
+        return f"{dt.day} {_MONTH_ABBR[dt.month]} {dt.year}"
 
     def get_available_products(self, file_path: Path) -> list[str]:
         """
@@ -271,7 +411,7 @@ class RevolutExcelTransactionExtractor:
             List of unique product names
         """
         try:
-            df = pd.read_excel(file_path)
+            df = _read_statement(file_path)
             return df[COLUMN_PRODUCT].dropna().unique().tolist()
         except Exception:
             return []
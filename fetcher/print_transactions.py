@@ -49,7 +49,14 @@ def main():
 
     print(f"Extracted {len(transactions)} transactions\n")
     print("=" * 100)
+    # Totals are accumulated while printing to walk the list only once
+    total_debit = total_credit = 0.0
     for i, tx in enumerate(transactions, 1):
+        if tx.transaction_type == "Debit":
+            total_debit += tx.amount
+        elif tx.transaction_type == "Credit":
+            total_credit += tx.amount
+
         balance_str = (
             f"Balance: {tx.balance:,.2f}" if tx.balance is not None else "Balance: N/A"
         )
@@ -59,12 +66,6 @@ def main():
     print("=" * 100)
 
     # Summary
-    total_debit = sum(
-        tx.amount for tx in transactions if tx.transaction_type == "Debit"
-    )
-    total_credit = sum(
-        tx.amount for tx in transactions if tx.transaction_type == "Credit"
-    )
     print(f"\nSummary:")
     print(f"  Debits: EUR {total_debit:,.2f}")
     print(f"  Credits: EUR {total_credit:,.2f}")
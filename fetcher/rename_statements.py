@@ -1,6 +1,7 @@
 """Rename statement PDFs based on extracted dates and parser name."""
 
 import argparse
+import os
 import shutil
 import sys
 from pathlib import Path
@@ -53,7 +54,10 @@ def sanitize_parser_name(parser_name: str) -> str:
 
 
 def rename_statements(
-    input_dir: Path, output_dir: Path = None, dry_run: bool = False
+    input_dir: Path,
+    output_dir: Path = None,
+    dry_run: bool = False,
+    max_workers: int = 1,
 ) -> dict:
     """
     Analyze statements and copy them with renamed filenames.
@@ -62,6 +66,8 @@ def rename_statements(
         input_dir: Directory containing PDF statement files
         output_dir: Directory to copy renamed files to (default: input_dir / "renamed")
         dry_run: If True, only print what would be done without copying files
+        max_workers: Number of worker processes used to analyze the PDFs
+            (1 analyzes files in the current process)
 
     Returns:
         Dictionary with statistics: {'copied': count, 'skipped': count, 'errors': count}
@@ -70,7 +76,7 @@ def rename_statements(
         output_dir = input_dir / "renamed"
 
     # Run analysis
-    analysis = analyze_statements(input_dir)
+    analysis = analyze_statements(input_dir, max_workers=max_workers)
     if analysis is None:
         print(f"Error: Could not analyze directory {input_dir}", file=sys.stderr)
         return {"copied": 0, "skipped": 0, "errors": 1}
@@ -153,6 +159,13 @@ def main():
         action="store_true",
         help="Show what would be done without actually copying files",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes used to analyze PDFs (default: CPU count)",
+    )
 
     args = parser.parse_args()
 
@@ -170,7 +183,9 @@ def main():
         sys.exit(1)
 
     # Run renaming
-    stats = rename_statements(args.input_dir, args.output, args.dry_run)
+    stats = rename_statements(
+        args.input_dir, args.output, args.dry_run, max_workers=args.jobs
+    )
 
     # Print summary
     print("\n" + "=" * 60)
@@ -23,10 +23,10 @@ from parsers import parse_statement
 
 
 class TestComputeFileSignature:
-    """Tests for SHA256 file signature computation."""
+    """Tests for BLAKE3 file signature computation."""
 
     def test_identical_files_produce_same_signature(self):
-        """Two files with identical content produce the same SHA256 signature."""
+        """Two files with identical content produce the same BLAKE3 signature."""
         # Arrange
         content = b"This is test content for PDF file"
 
@@ -45,13 +45,13 @@ class TestComputeFileSignature:
 
             # Assert
             assert signature1 == signature2
-            assert len(signature1) == 64  # SHA256 produces 64 hex characters
+            assert len(signature1) == 64  # BLAKE3 produces 64 hex characters
         finally:
             path1.unlink(missing_ok=True)
             path2.unlink(missing_ok=True)
 
     def test_different_files_produce_different_signatures(self):
-        """Two files with different content produce different SHA256 signatures."""
+        """Two files with different content produce different BLAKE3 signatures."""
         # Arrange
         with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp1:
             tmp1.write(b"Content A")
@@ -119,6 +119,17 @@ class TestParseDateFunction:
         assert result.month == 2
         assert result.year == 2017
 
+    def test_month_abbreviation_is_case_insensitive(self):
+        """Month abbreviation is matched regardless of case."""
+        # Arrange
+        date_str = "5 mar 2018"
+
+        # Act
+        result = parse_date(date_str)
+
+        # Assert
+        assert result == datetime(2018, 3, 5)
+
     def test_invalid_date_format_raises_exception(self):
         """Invalid date format raises ValueError exception."""
         # Arrange
@@ -138,8 +149,8 @@ class TestParseDateFunction:
             parse_date(invalid_date)
 
 
-class TestPydanticModels:
-    """Tests for Pydantic model validation and structure."""
+class TestModels:
+    """Tests for statement model structure."""
 
     def test_statement_info_model_validates_required_fields(self):
         """StatementInfo model correctly validates all required fields."""
@@ -163,6 +174,25 @@ class TestPydanticModels:
         assert statement.start_date == "1 Jan 2018"
         assert statement.start_date_parsed.year == 2018
 
+    def test_statement_info_formats_modified_timestamp(self):
+        """StatementInfo exposes the modification time formatted for reports."""
+        # Arrange
+        statement = StatementInfo(
+            file_name="test.pdf",
+            file_path="/path/to/test.pdf",
+            modified_timestamp=datetime(2024, 1, 2, 3, 4, 5, 678901),
+            file_signature="abc123",
+        )
+
+        # Act
+        modified_str = statement.modified_str
+
+        # Assert
+        assert modified_str == "2024-01-02 03:04:05"
+        assert modified_str == statement.modified_timestamp.strftime(
+            "%Y-%m-%d %H:%M:%S"
+        )
+
     def test_statement_break_model_stores_gap_information(self):
         """StatementBreak model correctly stores gap information between statements."""
         # Arrange
@@ -282,6 +312,66 @@ class TestAnalyzeAibStatements:
         assert len(result.summary.duplicates) == 1
         assert len(result.summary.duplicates[0].files) == 2
 
+    @patch("analyze_aib_dates.parse_statement")
+    @patch("analyze_aib_dates.compute_file_signature")
+    def test_duplicate_files_are_parsed_only_once(
+        self, mock_signature, mock_parse_statement
+    ):
+        """Files with the same signature are parsed once and share the parse result."""
+        # Arrange
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmppath = Path(tmpdir)
+
+            (tmppath / "statement1.pdf").write_bytes(b"content")
+            (tmppath / "statement2.pdf").write_bytes(b"content")
+
+            mock_signature.return_value = "same_signature_abc123"
+            mock_parse_statement.return_value = (
+                "1 Jun 2015",
+                "30 Jun 2015",
+                "Test Parser",
+            )
+
+            # Act
+            result = analyze_statements(tmppath)
+
+        # Assert
+        assert mock_parse_statement.call_count == 1
+        assert len(result.statements) == 2
+        assert all(s.start_date == "1 Jun 2015" for s in result.statements)
+
+    @patch("analyze_aib_dates.parse_statement")
+    @patch("analyze_aib_dates.compute_file_signature")
+    def test_cached_parse_results_are_reused_across_runs(
+        self, mock_signature, mock_parse_statement
+    ):
+        """With use_cache, a second run reuses stored results instead of parsing."""
+        # Arrange
+        with (
+            tempfile.TemporaryDirectory() as tmpdir,
+            tempfile.TemporaryDirectory() as cache_dir,
+            patch("cache.CACHE_DIR", Path(cache_dir)),
+        ):
+            tmppath = Path(tmpdir)
+            (tmppath / "statement1.pdf").write_bytes(b"content")
+
+            mock_signature.return_value = "signature_abc123"
+            mock_parse_statement.return_value = (
+                "1 Jun 2015",
+                "30 Jun 2015",
+                "Test Parser",
+            )
+
+            # Act
+            first_result = analyze_statements(tmppath, use_cache=True)
+            second_result = analyze_statements(tmppath, use_cache=True)
+
+        # Assert
+        assert mock_parse_statement.call_count == 1
+        assert second_result.statements[0].start_date == "1 Jun 2015"
+        assert second_result.statements[0].parser_name == "Test Parser"
+        assert first_result.summary == second_result.summary
+
     @patch("analyze_aib_dates.parse_statement")
     @patch("analyze_aib_dates.compute_file_signature")
     def test_statement_breaks_are_detected_when_gap_exceeds_one_day(
@@ -459,6 +549,30 @@ class TestAnalyzeAibStatements:
         assert len(result.statements) == 2
         assert result.statements[0].file_name == "old.pdf"
 
+    def test_parallel_analysis_matches_serial_analysis(self):
+        """Analysis with worker processes returns the same statements as serial analysis."""
+        # Arrange
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmppath = Path(tmpdir)
+
+            for index in range(3):
+                (tmppath / f"statement{index}.pdf").write_bytes(
+                    f"not a pdf {index}".encode()
+                )
+
+            # Act
+            serial = analyze_statements(tmppath)
+            parallel = analyze_statements(tmppath, max_workers=2)
+
+        # Assert
+        assert [s.file_name for s in parallel.statements] == [
+            s.file_name for s in serial.statements
+        ]
+        assert [s.file_signature for s in parallel.statements] == [
+            s.file_signature for s in serial.statements
+        ]
+        assert all(s.error is not None for s in parallel.statements)
+
 
 class TestEdgeCasesAndNegativeScenarios:
     """Tests for edge cases and negative scenarios handled by the code."""
@@ -473,7 +587,7 @@ class TestEdgeCasesAndNegativeScenarios:
             parse_date(empty_string)
 
     def test_compute_signature_with_empty_file(self):
-        """Empty file produces valid SHA256 signature."""
+        """Empty file produces valid BLAKE3 signature."""
         # Arrange
         with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
             path = Path(tmp.name)
@@ -487,7 +601,7 @@ class TestEdgeCasesAndNegativeScenarios:
             assert all(c in "0123456789abcdef" for c in signature)
             assert (
                 signature
-                == "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
+                == "af1349b9f5f9a1a6a0404dea36dcc9499bcb25c9adc112b7cc9a93cae41f3262"
             )
         finally:
             path.unlink(missing_ok=True)
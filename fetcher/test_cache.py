@@ -0,0 +1,87 @@
+"""Tests for the persistent on-disk cache helpers."""
+
+import pickle
+from unittest.mock import patch
+
+from cache import load_cache, save_cache
+
+
+class TestCache:
+    """Tests for load_cache() and save_cache()."""
+
+    def test_saved_entries_are_loaded_back(self, tmp_path):
+        """Entries saved under a name and version are returned by load_cache."""
+        # Arrange
+        entries = {"abc": ("1 Jun 2015", "30 Jun 2015", "Test Parser")}
+
+        # Act
+        with patch("cache.CACHE_DIR", tmp_path / "cache"):
+            save_cache("test", 1, entries)
+            loaded = load_cache("test", 1)
+
+        # Assert
+        assert loaded == entries
+
+    def test_missing_cache_loads_as_empty(self, tmp_path):
+        """A cache that was never saved loads as an empty dict."""
+        # Act
+        with patch("cache.CACHE_DIR", tmp_path):
+            loaded = load_cache("missing", 1)
+
+        # Assert
+        assert loaded == {}
+
+    def test_version_mismatch_loads_as_empty(self, tmp_path):
+        """A cache written with another version is ignored."""
+        # Act
+        with patch("cache.CACHE_DIR", tmp_path):
+            save_cache("test", 1, {"abc": "value"})
+            loaded = load_cache("test", 2)
+
+        # Assert
+        assert loaded == {}
+
+    def test_corrupt_cache_loads_as_empty(self, tmp_path):
+        """An unreadable cache file is ignored instead of raising."""
+        # Arrange
+        (tmp_path / "test.pkl").write_bytes(b"not a pickle")
+
+        # Act
+        with patch("cache.CACHE_DIR", tmp_path):
+            loaded = load_cache("test", 1)
+
+        # Assert
+        assert loaded == {}
+
+    def test_save_leaves_no_temporary_files(self, tmp_path):
+        """Saving replaces the cache file atomically without leftovers."""
+        # Act
+        with patch("cache.CACHE_DIR", tmp_path):
+            save_cache("test", 1, {"abc": "value"})
+            save_cache("test", 1, {"def": "value"})
+
+        # Assert
+        assert [p.name for p in tmp_path.iterdir()] == ["test.pkl"]
+        with open(tmp_path / "test.pkl", "rb") as f:
+            assert pickle.load(f) == (1, {"def": "value"})
+
+    def test_cache_of_missing_class_loads_as_empty(self, tmp_path):
+        """A cache referencing a class that no longer exists is ignored."""
+        # Arrange
+        (tmp_path / "test.pkl").write_bytes(b"cmissing_module\nStatementInfo\n.")
+
+        # Act
+        with patch("cache.CACHE_DIR", tmp_path):
+            loaded = load_cache("test", 1)
+
+        # Assert
+        assert loaded == {}
+
+    def test_failed_save_leaves_no_temporary_files(self, tmp_path):
+        """A save that fails while pickling removes its temporary file."""
+        # Act
+        with patch("cache.CACHE_DIR", tmp_path):
+            save_cache("test", 1, {"abc": lambda: None})
+
+        # Assert
+        assert list(tmp_path.iterdir()) == []
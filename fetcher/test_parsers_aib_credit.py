@@ -291,6 +291,64 @@ class TestAIBCreditParserExtractDates:
         assert result[0] == "10 May 2023"
         assert result[1] == "20 Jun 2023"
 
+    @patch("parsers.aib_credit.PdfReader")
+    def test_checks_first_page_before_middle_pages_for_end_date(
+        self, mock_reader_class
+    ):
+        """A header on the first page is found without reading the middle pages."""
+        # Arrange
+        mock_reader = Mock()
+        mock_reader_class.return_value = mock_reader
+
+        mock_first = Mock()
+        mock_first.extract_text.return_value = """
+        Account Statement - 20th June, 2023
+        10 May 11 May MERCHANT 75.00
+        """
+        mock_middle = Mock()
+        mock_middle.extract_text.return_value = "12 May 13 May OTHER 10.00"
+        mock_last = Mock()
+        mock_last.extract_text.return_value = "Page 3"
+
+        mock_reader.pages = [mock_first, mock_middle, mock_last]
+
+        # Act
+        parser = AIBCreditParser()
+        result = parser.extract_dates(Path("dummy.pdf"))
+
+        # Assert
+        assert result == ("10 May 2023", "20 Jun 2023")
+        mock_middle.extract_text.assert_not_called()
+
+    @patch("parsers.aib_credit.PdfReader")
+    def test_each_page_text_is_extracted_only_once(self, mock_reader_class):
+        """Each page is extracted at most once while finding both dates."""
+        # Arrange
+        mock_reader = Mock()
+        mock_reader_class.return_value = mock_reader
+
+        mock_page1 = Mock()
+        mock_page1.extract_text.return_value = """
+        Credit Limit: €5,000.00
+        10 May 11 May MERCHANT 75.00
+        """
+        mock_page2 = Mock()
+        mock_page2.extract_text.return_value = """
+        Account Statement - 20th June, 2023
+        """
+
+        mock_reader.pages = [mock_page1, mock_page2]
+
+        # Act
+        parser = AIBCreditParser()
+        result = parser.extract_dates(Path("dummy.pdf"))
+
+        # Assert
+        assert result == ("10 May 2023", "20 Jun 2023")
+        assert mock_page1.extract_text.call_count == 1
+        assert mock_page2.extract_text.call_count == 1
+        mock_reader.close.assert_called_once()
+
 
 class TestAIBCreditParserExtractTransactions:
     """Tests for extract_transactions() method."""
@@ -407,6 +465,34 @@ class TestAIBCreditParserExtractTransactions:
         assert result[0].exchange_rate == 2.000000
         assert result[0].fx_fee == 1.50
 
+    @patch("parsers.aib_credit.PdfReader")
+    def test_reference_takes_priority_over_fx_info_on_same_line(
+        self, mock_reader_class
+    ):
+        """A follow-on line with both FX info and a reference records the reference."""
+        # Arrange
+        mock_reader = Mock()
+        mock_reader_class.return_value = mock_reader
+
+        mock_page = Mock()
+        mock_page.extract_text.return_value = """
+        Account Statement - 25th April, 2025
+        Transaction Date Posting Date Details
+        15 Apr 15 Apr FOREIGN MERCHANT 100.00
+        12.50 USD @ rate of 1.08 Ref: 123
+        """
+
+        mock_reader.pages = [mock_page]
+
+        # Act
+        parser = AIBCreditParser()
+        result = parser.extract_transactions(Path("dummy.pdf"))
+
+        # Assert
+        assert len(result) == 1
+        assert result[0].reference == "123"
+        assert result[0].original_currency is None
+
     @patch("parsers.aib_credit.PdfReader")
     def test_extracts_multiple_transactions(self, mock_reader_class):
         """Extracts multiple transactions from the same statement."""
@@ -438,6 +524,61 @@ class TestAIBCreditParserExtractTransactions:
         assert result[2].amount == 100.00
         assert result[2].transaction_type == "Credit"
 
+    @patch("parsers.aib_credit.PdfReader")
+    def test_skips_lines_with_invalid_month(self, mock_reader_class):
+        """Lines shaped like transactions but without a valid month are skipped."""
+        # Arrange
+        mock_reader = Mock()
+        mock_reader_class.return_value = mock_reader
+
+        mock_page = Mock()
+        mock_page.extract_text.return_value = """
+        Account Statement - 30th May, 2025
+        Transaction Date Posting Date Details
+        12 Abc 12 Abc NOT A TRANSACTION 10.00
+        10 MAY 10 MAY MERCHANT ONE 25.00
+        """
+
+        mock_reader.pages = [mock_page]
+
+        # Act
+        parser = AIBCreditParser()
+        result = parser.extract_transactions(Path("dummy.pdf"))
+
+        # Assert
+        assert len(result) == 1
+        assert result[0].details == "MERCHANT ONE"
+        assert result[0].transaction_date == "10 MAY 2025"
+
+    @patch("parsers.aib_credit.PdfReader")
+    def test_skips_lines_without_a_trailing_amount(self, mock_reader_class):
+        """Lines whose last token is not a valid amount are skipped."""
+        # Arrange
+        mock_reader = Mock()
+        mock_reader_class.return_value = mock_reader
+
+        mock_page = Mock()
+        mock_page.extract_text.return_value = """
+        Account Statement - 30th May, 2025
+        Transaction Date Posting Date Details
+        10 May 10 May MERCHANT ONE 25.00 CR
+        11 May 11 May MERCHANT TWO 1234.56
+        12 May 12 May 25.00
+        13 May 13 May MERCHANT THREE 1,234.50CR
+        """
+
+        mock_reader.pages = [mock_page]
+
+        # Act
+        parser = AIBCreditParser()
+        result = parser.extract_transactions(Path("dummy.pdf"))
+
+        # Assert
+        assert len(result) == 1
+        assert result[0].details == "MERCHANT THREE"
+        assert result[0].amount == 1234.50
+        assert result[0].transaction_type == "Credit"
+
     @patch("parsers.aib_credit.PdfReader")
     def test_handles_exception_gracefully(self, mock_reader_class):
         """Exception during PDF processing returns empty list."""
@@ -472,3 +613,99 @@ class TestAIBCreditParserExtractTransactions:
 
         # Assert
         assert result == []
+
+
+class TestAIBCreditParserParse:
+    """Tests for parse() method."""
+
+    @patch("parsers.aib_credit.PdfReader")
+    def test_extracts_dates_and_transactions_reading_each_page_once(
+        self, mock_reader_class
+    ):
+        """parse() returns dates and transactions, extracting each page's text once."""
+        # Arrange
+        mock_reader = Mock()
+        mock_reader_class.return_value = mock_reader
+
+        mock_page1 = Mock()
+        mock_page1.extract_text.return_value = """
+        Credit Limit: €5,000.00
+        Account Statement - 11th January, 2026
+        Transaction Date Posting Date Details
+        13 Dec 15 Dec MERCHANT ONE 35.72
+        """
+        mock_page2 = Mock()
+        mock_page2.extract_text.return_value = """
+        5 Jan 5 Jan DIRECT DEBIT - THANK YOU 2,522.86CR
+        """
+
+        mock_reader.pages = [mock_page1, mock_page2]
+
+        # Act
+        parser = AIBCreditParser()
+        dates, transactions = parser.parse(Path("dummy.pdf"))
+
+        # Assert
+        assert dates == ("13 Dec 2025", "11 Jan 2026")
+        assert [tx.details for tx in transactions] == [
+            "MERCHANT ONE",
+            "DIRECT DEBIT - THANK YOU",
+        ]
+        assert transactions[1].transaction_type == "Credit"
+        assert mock_page1.extract_text.call_count == 1
+        assert mock_page2.extract_text.call_count == 1
+
+    @patch("parsers.aib_credit.PdfReader")
+    def test_handles_exception_gracefully(self, mock_reader_class):
+        """Exception during PDF reading returns no dates and no transactions."""
+        # Arrange
+        mock_reader_class.side_effect = Exception("PDF error")
+
+        # Act
+        parser = AIBCreditParser()
+        result = parser.parse(Path("dummy.pdf"))
+
+        # Assert
+        assert result == (None, [])
+
+
+class TestAIBCreditParserIterTransactions:
+    """Tests for iter_transactions() method."""
+
+    @patch("parsers.aib_credit.PdfReader")
+    def test_yields_transactions_in_statement_order(self, mock_reader_class):
+        """Transactions are yielded one at a time, in statement order."""
+        # Arrange
+        mock_reader = Mock()
+        mock_reader_class.return_value = mock_reader
+
+        mock_page = Mock()
+        mock_page.extract_text.return_value = """
+        Account Statement - 30th May, 2025
+        Transaction Date Posting Date Details
+        10 May 10 May MERCHANT ONE 25.00
+        15 May 15 May MERCHANT TWO 50.00
+        """
+
+        mock_reader.pages = [mock_page]
+
+        # Act
+        parser = AIBCreditParser()
+        transactions = parser.iter_transactions(Path("dummy.pdf"))
+        first = next(transactions)
+        rest = list(transactions)
+
+        # Assert
+        assert first.details == "MERCHANT ONE"
+        assert [tx.details for tx in rest] == ["MERCHANT TWO"]
+
+    @patch("parsers.aib_credit.PdfReader")
+    def test_raises_reading_errors(self, mock_reader_class):
+        """Errors reading the PDF propagate to the caller."""
+        # Arrange
+        mock_reader_class.side_effect = Exception("PDF error")
+
+        # Act & Assert
+        parser = AIBCreditParser()
+        with pytest.raises(Exception, match="PDF error"):
+            list(parser.iter_transactions(Path("dummy.pdf")))
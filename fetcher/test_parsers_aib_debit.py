@@ -100,6 +100,68 @@ IBAN: IE12 BANK 1234 5612 3456 78
         assert result[0] == "3 Apr 2017"
         assert result[1] == "28 Apr 2017"
 
+    @patch("parsers.aib_debit.PdfReader")
+    def test_balance_forward_wins_over_earlier_transaction_date(
+        self, mock_reader_class
+    ):
+        """BALANCE FORWARD later on the page is preferred over an earlier date."""
+        # Arrange
+        mock_reader = Mock()
+        mock_reader_class.return_value = mock_reader
+
+        mock_page = Mock()
+        mock_page.extract_text.return_value = """
+Date Details Debit € Credit € Balance €
+1 Mar 2017 Interest Rate
+2 Mar 2017 BALANCE FORWARD 1234.56
+5 Mar 2017 TEST TRANSACTION 100.00
+Date of Statement
+28 Mar 2017
+        """
+
+        mock_reader.pages = [mock_page]
+
+        # Act
+        parser = AIBDebitParser()
+        result = parser.extract_dates(Path("dummy.pdf"))
+
+        # Assert
+        assert result == ("2 Mar 2017", "28 Mar 2017")
+
+    @patch("parsers.aib_debit.PdfReader")
+    def test_each_page_text_is_extracted_only_once(self, mock_reader_class):
+        """Each page is extracted at most once while finding both dates."""
+        # Arrange
+        mock_reader = Mock()
+        mock_reader_class.return_value = mock_reader
+
+        mock_page1 = Mock()
+        mock_page1.extract_text.return_value = """
+Date Details Debit € Credit € Balance €
+8 May 2016 Interest Rate
+TEST TRANSACTION 250.00
+        """
+
+        mock_page2 = Mock()
+        mock_page2.extract_text.return_value = """
+10 May 2016 BALANCE FORWARD 1234.56
+Date of Statement
+31 May 2016
+IBAN: IE98 BANK 7654 3298 7654 32
+        """
+
+        mock_reader.pages = [mock_page1, mock_page2]
+
+        # Act
+        parser = AIBDebitParser()
+        result = parser.extract_dates(Path("dummy.pdf"))
+
+        # Assert
+        assert result == ("10 May 2016", "31 May 2016")
+        assert mock_page1.extract_text.call_count == 1
+        assert mock_page2.extract_text.call_count == 1
+        mock_reader.close.assert_called_once()
+
     @patch("parsers.aib_debit.PdfReader")
     def test_first_transaction_date_used_when_no_balance_forward(
         self, mock_reader_class
@@ -301,12 +363,92 @@ Additional content to ensure page has more than 50 characters
         assert result is not None
         assert result[1] == "30 Jun 2018"
 
+    @patch("parsers.aib_debit.PdfReader")
+    def test_unchanged_file_is_read_only_once(self, mock_reader_class, tmp_path):
+        """Dates of an unchanged file are cached; changing the file rereads it."""
+        # Arrange
+        pdf_path = tmp_path / "statement.pdf"
+        pdf_path.write_bytes(b"%PDF")
+
+        mock_reader = Mock()
+        mock_reader_class.return_value = mock_reader
+
+        mock_page = Mock()
+        mock_page.extract_text.return_value = """
+Date of Statement 28 Apr 2017
+3 Apr 2017 BALANCE FORWARD 1234.56
+TEST TRANSACTION 100.00
+        """
+        mock_reader.pages = [mock_page]
+
+        parser = AIBDebitParser()
+
+        # Act
+        first = parser.extract_dates(pdf_path)
+        second = parser.extract_dates(pdf_path)
+        calls_before_change = mock_reader_class.call_count
+        pdf_path.write_bytes(b"%PDF-1.7")
+        third = parser.extract_dates(pdf_path)
+
+        # Assert
+        assert first == second == third == ("3 Apr 2017", "28 Apr 2017")
+        assert calls_before_change == 1
+        assert mock_reader_class.call_count == 2
+
+    @patch("parsers.aib_debit.PdfReader")
+    def test_short_page_check_counts_raw_whitespace(self, mock_reader_class):
+        """A page is long enough for the end date by its raw text, not collapsed text."""
+        # Arrange
+        mock_reader = Mock()
+        mock_reader_class.return_value = mock_reader
+
+        mock_page = Mock()
+        mock_page.extract_text.return_value = (
+            "Date of Statement" + " " * 40 + "\n28 Apr 2017"
+        )
+        mock_reader.pages = [mock_page]
+
+        # Act
+        parser = AIBDebitParser()
+        result = parser.extract_dates(Path("dummy.pdf"))
+
+        # Assert
+        assert result == ("28 Apr 2017", "28 Apr 2017")
+
+    @patch("parsers.aib_debit.PdfReader")
+    def test_fallback_context_window_uses_raw_page_text(self, mock_reader_class):
+        """Header text far above a date in the page layout does not exclude it."""
+        # Arrange
+        mock_reader = Mock()
+        mock_reader_class.return_value = mock_reader
+
+        mock_page1 = Mock()
+        mock_page1.extract_text.return_value = (
+            "Date of Statement" + "\n" * 60 + "5 Apr 2017 TEST TRANSACTION 100.00"
+        )
+
+        mock_page_last = Mock()
+        mock_page_last.extract_text.return_value = """
+Date of Statement
+28 Apr 2017
+IBAN: IE12 BANK 1234 5612 3456 78
+        """
+
+        mock_reader.pages = [mock_page1, mock_page_last]
+
+        # Act
+        parser = AIBDebitParser()
+        result = parser.extract_dates(Path("dummy.pdf"))
+
+        # Assert
+        assert result == ("5 Apr 2017", "28 Apr 2017")
+
 
 class TestAIBDebitParserExtractTransactions:
     """Tests for extract_transactions() method."""
 
-    @patch("parsers.aib_debit.pdfplumber")
-    def test_extracts_simple_debit_transaction(self, mock_pdfplumber):
+    @patch("parsers.aib_debit.PdfReader")
+    def test_extracts_simple_debit_transaction(self, mock_pdf_reader):
         """Extracts a simple debit transaction with amount in debit column."""
         # Arrange
         mock_pdf = Mock()
@@ -330,7 +472,7 @@ class TestAIBDebitParserExtractTransactions:
             {"text": "5000.00", "x0": 460, "x1": 520, "top": 150},  # Balance
         ]
         mock_pdf.pages = [mock_page]
-        mock_pdfplumber.open.return_value.__enter__.return_value = mock_pdf
+        mock_pdf_reader.return_value.__enter__.return_value = mock_pdf
 
         # Act
         parser = AIBDebitParser()
@@ -344,8 +486,8 @@ class TestAIBDebitParserExtractTransactions:
         assert result[0].details == "TEST MERCHANT"
         assert result[0].balance == 5000.00
 
-    @patch("parsers.aib_debit.pdfplumber")
-    def test_extracts_simple_credit_transaction(self, mock_pdfplumber):
+    @patch("parsers.aib_debit.PdfReader")
+    def test_extracts_simple_credit_transaction(self, mock_pdf_reader):
         """Extracts a simple credit transaction with amount in credit column."""
         # Arrange
         mock_pdf = Mock()
@@ -369,7 +511,7 @@ class TestAIBDebitParserExtractTransactions:
             {"text": "7500.00", "x0": 460, "x1": 520, "top": 150},  # Balance
         ]
         mock_pdf.pages = [mock_page]
-        mock_pdfplumber.open.return_value.__enter__.return_value = mock_pdf
+        mock_pdf_reader.return_value.__enter__.return_value = mock_pdf
 
         # Act
         parser = AIBDebitParser()
@@ -383,8 +525,8 @@ class TestAIBDebitParserExtractTransactions:
         assert result[0].details == "SALARY PAYMENT"
         assert result[0].balance == 7500.00
 
-    @patch("parsers.aib_debit.pdfplumber")
-    def test_extracts_opening_balance_transaction(self, mock_pdfplumber):
+    @patch("parsers.aib_debit.PdfReader")
+    def test_extracts_opening_balance_transaction(self, mock_pdf_reader):
         """Extracts opening balance as a transaction with zero amount."""
         # Arrange
         mock_pdf = Mock()
@@ -402,7 +544,7 @@ class TestAIBDebitParserExtractTransactions:
             {"text": "1000.00", "x0": 460, "x1": 520, "top": 150},  # Balance only
         ]
         mock_pdf.pages = [mock_page]
-        mock_pdfplumber.open.return_value.__enter__.return_value = mock_pdf
+        mock_pdf_reader.return_value.__enter__.return_value = mock_pdf
 
         # Act
         parser = AIBDebitParser()
@@ -415,8 +557,8 @@ class TestAIBDebitParserExtractTransactions:
         assert result[0].details == "OPENING BALANCE"
         assert result[0].balance == 1000.00
 
-    @patch("parsers.aib_debit.pdfplumber")
-    def test_extracts_multiple_transactions_on_same_day(self, mock_pdfplumber):
+    @patch("parsers.aib_debit.PdfReader")
+    def test_extracts_multiple_transactions_on_same_day(self, mock_pdf_reader):
         """Extracts multiple transactions that occur on the same day."""
         # Arrange
         mock_pdf = Mock()
@@ -439,7 +581,7 @@ class TestAIBDebitParserExtractTransactions:
             {"text": "4925.00", "x0": 460, "x1": 520, "top": 180},
         ]
         mock_pdf.pages = [mock_page]
-        mock_pdfplumber.open.return_value.__enter__.return_value = mock_pdf
+        mock_pdf_reader.return_value.__enter__.return_value = mock_pdf
 
         # Act
         parser = AIBDebitParser()
@@ -454,8 +596,8 @@ class TestAIBDebitParserExtractTransactions:
         assert result[1].transaction_date == "10 May 2024"  # Same date
         assert result[1].details == "MERCHANT2"
 
-    @patch("parsers.aib_debit.pdfplumber")
-    def test_extracts_transaction_with_reference_number(self, mock_pdfplumber):
+    @patch("parsers.aib_debit.PdfReader")
+    def test_extracts_transaction_with_reference_number(self, mock_pdf_reader):
         """Extracts transaction with reference number on following line."""
         # Arrange
         mock_pdf = Mock()
@@ -475,7 +617,7 @@ class TestAIBDebitParserExtractTransactions:
             {"text": "IE12345678901234", "x0": 150, "x1": 300, "top": 180},
         ]
         mock_pdf.pages = [mock_page]
-        mock_pdfplumber.open.return_value.__enter__.return_value = mock_pdf
+        mock_pdf_reader.return_value.__enter__.return_value = mock_pdf
 
         # Act
         parser = AIBDebitParser()
@@ -486,8 +628,8 @@ class TestAIBDebitParserExtractTransactions:
         assert result[0].amount == 200.00
         assert result[0].reference == "IE12345678901234"
 
-    @patch("parsers.aib_debit.pdfplumber")
-    def test_returns_empty_list_when_no_column_headers_found(self, mock_pdfplumber):
+    @patch("parsers.aib_debit.PdfReader")
+    def test_returns_empty_list_when_no_column_headers_found(self, mock_pdf_reader):
         """Returns empty list when column headers cannot be identified."""
         # Arrange
         mock_pdf = Mock()
@@ -500,7 +642,7 @@ class TestAIBDebitParserExtractTransactions:
             {"text": "text", "x0": 165, "x1": 200, "top": 100},
         ]
         mock_pdf.pages = [mock_page]
-        mock_pdfplumber.open.return_value.__enter__.return_value = mock_pdf
+        mock_pdf_reader.return_value.__enter__.return_value = mock_pdf
 
         # Act
         parser = AIBDebitParser()
@@ -509,11 +651,11 @@ class TestAIBDebitParserExtractTransactions:
         # Assert
         assert result == []
 
-    @patch("parsers.aib_debit.pdfplumber")
-    def test_handles_exception_gracefully(self, mock_pdfplumber):
+    @patch("parsers.aib_debit.PdfReader")
+    def test_handles_exception_gracefully(self, mock_pdf_reader):
         """Exception during PDF processing returns empty list."""
         # Arrange
-        mock_pdfplumber.open.side_effect = Exception("PDF error")
+        mock_pdf_reader.side_effect = Exception("PDF error")
 
         # Act
         parser = AIBDebitParser()
@@ -522,8 +664,8 @@ class TestAIBDebitParserExtractTransactions:
         # Assert
         assert result == []
 
-    @patch("parsers.aib_debit.pdfplumber")
-    def test_filters_out_footer_keywords(self, mock_pdfplumber):
+    @patch("parsers.aib_debit.PdfReader")
+    def test_filters_out_footer_keywords(self, mock_pdf_reader):
         """Footer keywords are filtered out and not included in transactions."""
         # Arrange
         mock_pdf = Mock()
@@ -546,7 +688,7 @@ class TestAIBDebitParserExtractTransactions:
             {"text": "banking", "x0": 165, "x1": 230, "top": 700},
         ]
         mock_pdf.pages = [mock_page]
-        mock_pdfplumber.open.return_value.__enter__.return_value = mock_pdf
+        mock_pdf_reader.return_value.__enter__.return_value = mock_pdf
 
         # Act
         parser = AIBDebitParser()
@@ -556,3 +698,74 @@ class TestAIBDebitParserExtractTransactions:
         assert len(result) == 1
         assert result[0].details == "TRANSACTION"
         # Footer should not create a transaction
+
+    @patch("parsers.aib_debit.PdfReader")
+    def test_each_page_words_are_extracted_only_once(self, mock_pdf_reader):
+        """Header detection and extraction share one extract_words() per page."""
+        # Arrange
+        mock_pdf = Mock()
+        header_page = Mock()
+        header_page.extract_words.return_value = [
+            {"text": "Debit", "x0": 250, "x1": 300, "top": 100},
+            {"text": "Credit", "x0": 350, "x1": 400, "top": 100},
+            {"text": "Balance", "x0": 450, "x1": 500, "top": 100},
+            {"text": "15", "x0": 50, "x1": 70, "top": 150},
+            {"text": "Jul", "x0": 75, "x1": 100, "top": 150},
+            {"text": "2024", "x0": 105, "x1": 140, "top": 150},
+            {"text": "SHOP", "x0": 150, "x1": 200, "top": 150},
+            {"text": "75.00", "x0": 280, "x1": 330, "top": 150},
+        ]
+        second_page = Mock()
+        second_page.extract_words.return_value = [
+            {"text": "16", "x0": 50, "x1": 70, "top": 150},
+            {"text": "Jul", "x0": 75, "x1": 100, "top": 150},
+            {"text": "2024", "x0": 105, "x1": 140, "top": 150},
+            {"text": "SALARY", "x0": 150, "x1": 200, "top": 150},
+            {"text": "500.00", "x0": 360, "x1": 410, "top": 150},
+        ]
+        mock_pdf.pages = [header_page, second_page]
+        mock_pdf_reader.return_value.__enter__.return_value = mock_pdf
+
+        # Act
+        parser = AIBDebitParser()
+        result = parser.extract_transactions(Path("dummy.pdf"))
+
+        # Assert
+        assert [tx.details for tx in result] == ["SHOP", "SALARY"]
+        header_page.extract_words.assert_called_once()
+        second_page.extract_words.assert_called_once()
+
+    @patch("parsers.aib_debit.PdfReader")
+    def test_cached_transactions_are_copied_for_each_call(
+        self, mock_pdf_reader, tmp_path
+    ):
+        """Changing a returned transaction doesn't affect later calls for the file."""
+        # Arrange
+        pdf_path = tmp_path / "statement.pdf"
+        pdf_path.write_bytes(b"%PDF")
+
+        mock_pdf = Mock()
+        page = Mock()
+        page.extract_words.return_value = [
+            {"text": "Debit", "x0": 250, "x1": 300, "top": 100},
+            {"text": "Credit", "x0": 350, "x1": 400, "top": 100},
+            {"text": "Balance", "x0": 450, "x1": 500, "top": 100},
+            {"text": "15", "x0": 50, "x1": 70, "top": 150},
+            {"text": "Jul", "x0": 75, "x1": 100, "top": 150},
+            {"text": "2024", "x0": 105, "x1": 140, "top": 150},
+            {"text": "SHOP", "x0": 150, "x1": 200, "top": 150},
+            {"text": "75.00", "x0": 280, "x1": 330, "top": 150},
+        ]
+        mock_pdf.pages = [page]
+        mock_pdf_reader.return_value.__enter__.return_value = mock_pdf
+
+        parser = AIBDebitParser()
+
+        # Act
+        first = parser.extract_transactions(pdf_path)
+        first[0].details = "CHANGED"
+        second = parser.extract_transactions(pdf_path)
+
+        # Assert
+        assert [tx.details for tx in second] == ["SHOP"]
+        mock_pdf_reader.assert_called_once()
@@ -0,0 +1,123 @@
+"""Tests for batch statement parsing."""
+
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from parsers.batch import parse_many, parse_pdf
+from parsers.aib_debit import AIBDebitParser
+import parsers.aib_credit  # noqa: F401  (registers the credit parser)
+
+CREDIT_STATEMENT_TEXT = """
+Credit Limit: €5,000.00
+Account Statement - 11th January, 2026
+Transaction Date Posting Date Details
+13 Dec 15 Dec MERCHANT 50.00
+"""
+
+
+class TestParsePdf:
+    """Tests for parse_pdf()."""
+
+    @patch("parsers.aib_credit.PdfReader")
+    @patch("parsers.registry.PdfReader")
+    def test_returns_parser_name_dates_and_transactions(
+        self, mock_registry_reader, mock_credit_reader
+    ):
+        """Returns the detected parser's name, statement dates and transactions."""
+        # Arrange
+        mock_reader = Mock()
+        mock_registry_reader.return_value = mock_reader
+        mock_credit_reader.return_value = mock_reader
+
+        mock_page = Mock()
+        mock_page.extract_text.return_value = CREDIT_STATEMENT_TEXT
+        mock_reader.pages = [mock_page]
+
+        # Act
+        result = parse_pdf(Path("credit.pdf"))
+
+        # Assert
+        assert result is not None
+        parser_name, dates, transactions = result
+        assert parser_name == "AIB Credit Card"
+        assert dates == ("13 Dec 2025", "11 Jan 2026")
+        assert [tx.details for tx in transactions] == ["MERCHANT"]
+
+    @patch("parsers.registry.PdfReader")
+    def test_returns_none_when_no_parser_matches(self, mock_reader_class):
+        """Returns None when no registered parser can handle the PDF."""
+        # Arrange
+        mock_reader = Mock()
+        mock_reader_class.return_value = mock_reader
+
+        mock_page = Mock()
+        mock_page.extract_text.return_value = "Random PDF content"
+        mock_reader.pages = [mock_page]
+
+        # Act
+        result = parse_pdf(Path("unknown.pdf"))
+
+        # Assert
+        assert result is None
+
+    @patch("parsers.registry.PdfReader")
+    def test_skips_transactions_when_dates_cannot_be_extracted(self, mock_reader_class):
+        """Parsers without parse() are not asked for transactions without dates."""
+        # Arrange
+        mock_reader = Mock()
+        mock_reader_class.return_value = mock_reader
+
+        mock_page = Mock()
+        mock_page.extract_text.return_value = """
+        Statement of Account with Allied Irish Banks, p.l.c.
+        Personal Bank Account
+        """
+        mock_reader.pages = [mock_page]
+
+        # Act
+        with (
+            patch.object(AIBDebitParser, "extract_dates", return_value=None),
+            patch.object(AIBDebitParser, "extract_transactions") as mock_extract,
+        ):
+            result = parse_pdf(Path("debit.pdf"))
+
+        # Assert
+        assert result is None
+        mock_extract.assert_not_called()
+
+    def test_falls_back_to_next_matching_parser_when_dates_fail(self):
+        """The next matching parser is tried when the first extracts no dates."""
+        # Arrange
+        failing = Mock(spec=["name", "extract_dates", "extract_transactions"])
+        failing.extract_dates.return_value = None
+        working = Mock(spec=["name", "extract_dates", "extract_transactions"])
+        working.name = "Working Parser"
+        working.extract_dates.return_value = ("1 Jan 2025", "31 Jan 2025")
+        working.extract_transactions.return_value = ["tx"]
+
+        # Act
+        with patch("parsers.batch.detect_parsers", return_value=[failing, working]):
+            result = parse_pdf(Path("statement.pdf"))
+
+        # Assert
+        assert result == ("Working Parser", ("1 Jan 2025", "31 Jan 2025"), ["tx"])
+        failing.extract_transactions.assert_not_called()
+
+
+class TestParseMany:
+    """Tests for parse_many()."""
+
+    def test_returns_results_in_input_order(self):
+        """Results are returned in the same order as the given paths."""
+        # Arrange
+        paths = [Path("a.pdf"), Path("b.pdf"), Path("c.pdf")]
+
+        # Act
+        with patch(
+            "parsers.batch.parse_pdf", side_effect=lambda path: path.stem
+        ) as mock_parse:
+            results = parse_many(paths)
+
+        # Assert
+        assert results == ["a", "b", "c"]
+        assert mock_parse.call_count == 3
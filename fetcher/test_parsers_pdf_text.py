@@ -0,0 +1,108 @@
+"""Tests for the PyMuPDF-backed PdfReader shim."""
+
+import pymupdf
+import pytest
+
+from parsers.pdf_text import PdfReader
+
+
+def _write_pdf(path, pages):
+    """Write a PDF where each page is a list of (x, y, text) insertions."""
+    document = pymupdf.open()
+    for insertions in pages:
+        page = document.new_page()
+        for x, y, text in insertions:
+            page.insert_text((x, y), text)
+    document.save(path)
+    document.close()
+    return path
+
+
+class TestPdfReader:
+    """Tests for PdfReader page access and text extraction."""
+
+    def test_table_row_is_extracted_as_single_line(self, tmp_path):
+        """Words on the same row in separate columns are joined into one line."""
+        # Arrange
+        pdf_path = _write_pdf(
+            tmp_path / "statement.pdf",
+            [
+                [
+                    (300, 100, "1234.56"),
+                    (50, 100, "3 Apr 2017"),
+                    (120, 100, "BALANCE FORWARD"),
+                    (50, 120, "Date of Statement"),
+                ]
+            ],
+        )
+
+        # Act
+        reader = PdfReader(pdf_path)
+        text = reader.pages[0].extract_text()
+        reader.close()
+
+        # Assert
+        assert text.splitlines() == [
+            "3 Apr 2017 BALANCE FORWARD 1234.56",
+            "Date of Statement",
+        ]
+
+    def test_pages_support_len_negative_index_and_reversed(self, tmp_path):
+        """Pages behave like pypdf's page list."""
+        # Arrange
+        pdf_path = _write_pdf(
+            tmp_path / "statement.pdf",
+            [[(50, 100, "first")], [(50, 100, "second")], [(50, 100, "third")]],
+        )
+
+        # Act
+        with PdfReader(pdf_path) as reader:
+            page_count = len(reader.pages)
+            last_text = reader.pages[-1].extract_text()
+            reversed_texts = [page.extract_text() for page in reversed(reader.pages)]
+
+        # Assert
+        assert page_count == 3
+        assert last_text == "third"
+        assert reversed_texts == ["third", "second", "first"]
+
+    def test_out_of_range_page_raises_index_error(self, tmp_path):
+        """Indexing past the last page raises IndexError."""
+        # Arrange
+        pdf_path = _write_pdf(tmp_path / "statement.pdf", [[(50, 100, "only")]])
+
+        # Act & Assert
+        with PdfReader(pdf_path) as reader:
+            with pytest.raises(IndexError):
+                reader.pages[1]
+
+    def test_empty_page_returns_empty_string(self, tmp_path):
+        """A page without text extracts as an empty string."""
+        # Arrange
+        pdf_path = _write_pdf(tmp_path / "statement.pdf", [[]])
+
+        # Act
+        with PdfReader(pdf_path) as reader:
+            text = reader.pages[0].extract_text()
+
+        # Assert
+        assert text == ""
+
+    def test_words_are_extracted_with_positions(self, tmp_path):
+        """extract_words() returns pdfplumber-style word dicts in reading order."""
+        # Arrange
+        pdf_path = _write_pdf(
+            tmp_path / "statement.pdf",
+            [[(300, 100, "100.00"), (50, 100, "SHOP"), (50, 120, "NEXT")]],
+        )
+
+        # Act
+        with PdfReader(pdf_path) as reader:
+            words = reader.pages[0].extract_words()
+
+        # Assert
+        assert [word["text"] for word in words] == ["SHOP", "100.00", "NEXT"]
+        assert words[0]["x0"] == pytest.approx(50)
+        assert words[1]["x0"] == pytest.approx(300)
+        assert words[0]["top"] == pytest.approx(words[1]["top"])
+        assert words[0]["top"] < words[0]["bottom"] <= words[2]["top"] + 5
@@ -4,9 +4,15 @@ import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
-from parsers.registry import register_parser, parse_statement, get_registered_parsers
+from parsers.registry import (
+    detect_parser,
+    register_parser,
+    parse_statement,
+    get_registered_parsers,
+)
 from parsers.aib_debit import AIBDebitParser
 from parsers.aib_credit import AIBCreditParser
+import parsers.revolut_debit  # noqa: F401  (registers the Revolut parser)
 
 
 class TestParserRegistry:
@@ -214,3 +220,73 @@ class TestParseStatementAutoDetection:
 
         # Assert
         assert result is None
+
+    @patch("parsers.revolut_debit.PdfReader")
+    @patch("parsers.registry.PdfReader")
+    def test_revolut_parser_reuses_detection_reader(
+        self, mock_registry_reader, mock_revolut_reader
+    ):
+        """The Revolut parser reads dates from the reader opened for detection."""
+        # Arrange
+        mock_reader = Mock()
+        mock_registry_reader.return_value = mock_reader
+
+        mock_page = Mock()
+        mock_page.extract_text.return_value = """
+        EUR Statement
+        Revolut Bank UAB
+        Account transactions from 1 July 2025 to 19 January 2026
+        5 Jul 2025 - 5 Jul 2025 Top-up €50.00 €50.00
+        15 Jan 2026 - 15 Jan 2026 Payment €10.00 €20.00
+        """
+        mock_reader.pages = [mock_page]
+
+        # Act
+        result = parse_statement(Path("revolut.pdf"))
+
+        # Assert
+        assert result == ("5 Jul 2025", "15 Jan 2026", "Revolut Debit Account")
+        mock_registry_reader.assert_called_once()
+        mock_revolut_reader.assert_not_called()
+
+
+class TestDetectParser:
+    """Tests for parser detection without date extraction."""
+
+    @patch("parsers.registry.PdfReader")
+    def test_returns_matching_parser(self, mock_reader_class):
+        """Returns the registered parser that recognizes the first page."""
+        # Arrange
+        mock_reader = Mock()
+        mock_reader_class.return_value = mock_reader
+
+        mock_page = Mock()
+        mock_page.extract_text.return_value = """
+        Credit Limit: €5,000.00
+        Account Statement - 11th January, 2026
+        """
+        mock_reader.pages = [mock_page]
+
+        # Act
+        parser = detect_parser(Path("credit.pdf"))
+
+        # Assert
+        assert parser is not None
+        assert parser.name == "AIB Credit Card"
+
+    @patch("parsers.registry.PdfReader")
+    def test_returns_none_when_no_parser_matches(self, mock_reader_class):
+        """Returns None when no registered parser can handle the PDF."""
+        # Arrange
+        mock_reader = Mock()
+        mock_reader_class.return_value = mock_reader
+
+        mock_page = Mock()
+        mock_page.extract_text.return_value = "Random PDF content"
+        mock_reader.pages = [mock_page]
+
+        # Act
+        parser = detect_parser(Path("unknown.pdf"))
+
+        # Assert
+        assert parser is None
@@ -447,3 +447,19 @@ class TestRenameStatements:
             # Assert
             assert stats["errors"] == 1
             assert stats["copied"] == 0
+
+    @patch("rename_statements.analyze_statements")
+    def test_passes_worker_count_to_analysis(self, mock_analyze):
+        """The worker count is passed on to the statement analysis."""
+        # Arrange
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_dir = Path(tmpdir) / "input"
+            input_dir.mkdir()
+
+            mock_analyze.return_value = None
+
+            # Act
+            rename_statements(input_dir, max_workers=4)
+
+            # Assert
+            mock_analyze.assert_called_once_with(input_dir, max_workers=4)
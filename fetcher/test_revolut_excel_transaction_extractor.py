@@ -1,5 +1,7 @@
 """Tests for Revolut Excel transaction extractor."""
 
+import zipfile
+
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -94,6 +96,111 @@ class TestRevolutExcelCanParse:
         # Assert
         assert result is False
 
+    @patch("parsers.revolut_excel_transaction_extractor.pd.read_excel")
+    def test_rejects_workbook_without_header_text_unread(
+        self, mock_read_excel, tmp_path
+    ):
+        """Workbooks whose cell text lacks the Revolut headers are not read by pandas."""
+        # Arrange
+        file_path = tmp_path / "other.xlsx"
+        with zipfile.ZipFile(file_path, "w") as workbook:
+            workbook.writestr(
+                "xl/sharedStrings.xml", "<sst><si><t>Invoice Number</t></si></sst>"
+            )
+        extractor = RevolutExcelTransactionExtractor()
+
+        # Act
+        result = extractor.can_parse(file_path)
+
+        # Assert
+        assert result is False
+        mock_read_excel.assert_not_called()
+
+    @patch("parsers.revolut_excel_transaction_extractor.pd.read_excel")
+    def test_reads_header_of_workbook_with_inline_header_text(
+        self, mock_read_excel, tmp_path
+    ):
+        """Header text stored inline in the sheet passes the precheck."""
+        # Arrange
+        file_path = tmp_path / "statement.xlsx"
+        with zipfile.ZipFile(file_path, "w") as workbook:
+            workbook.writestr(
+                "xl/worksheets/sheet1.xml",
+                '<worksheet><c t="inlineStr"><is><t>Completed Date</t></is></c>'
+                "</worksheet>",
+            )
+        mock_read_excel.return_value = pd.DataFrame(columns=["Completed Date"])
+        extractor = RevolutExcelTransactionExtractor()
+
+        # Act
+        result = extractor.can_parse(file_path)
+
+        # Assert
+        assert result is False
+        mock_read_excel.assert_called_once()
+
+    @patch("parsers.revolut_excel_transaction_extractor.pd.read_excel")
+    def test_reads_header_of_workbook_with_differently_named_sheet(
+        self, mock_read_excel, tmp_path
+    ):
+        """Header text in a sheet part not named sheet1.xml passes the precheck."""
+        # Arrange
+        file_path = tmp_path / "statement.xlsx"
+        with zipfile.ZipFile(file_path, "w") as workbook:
+            workbook.writestr(
+                "xl/worksheets/Transactions.xml",
+                '<worksheet><row r="1"><c t="inlineStr"><is><t>Completed Date</t>'
+                "</is></c></row></worksheet>",
+            )
+        mock_read_excel.return_value = pd.DataFrame(columns=["Completed Date"])
+        extractor = RevolutExcelTransactionExtractor()
+
+        # Act
+        extractor.can_parse(file_path)
+
+        # Assert
+        mock_read_excel.assert_called_once()
+
+    @patch("parsers.revolut_excel_transaction_extractor.pd.read_excel")
+    def test_reads_header_when_shared_strings_exceed_probe(
+        self, mock_read_excel, tmp_path
+    ):
+        """Shared strings too long to inspect fully leave the decision to pandas."""
+        # Arrange
+        file_path = tmp_path / "statement.xlsx"
+        strings = "".join(f"<si><t>Text {i}</t></si>" for i in range(1000))
+        with zipfile.ZipFile(file_path, "w") as workbook:
+            workbook.writestr(
+                "xl/sharedStrings.xml",
+                f"<sst>{strings}<si><t>Completed Date</t></si></sst>",
+            )
+        mock_read_excel.return_value = pd.DataFrame(columns=["Completed Date"])
+        extractor = RevolutExcelTransactionExtractor()
+
+        # Act
+        extractor.can_parse(file_path)
+
+        # Assert
+        mock_read_excel.assert_called_once()
+
+    @patch("parsers.revolut_excel_transaction_extractor.pd.read_excel")
+    def test_reads_header_when_workbook_has_no_text_parts(
+        self, mock_read_excel, tmp_path
+    ):
+        """Workbooks without recognizable cell text parts leave the decision to pandas."""
+        # Arrange
+        file_path = tmp_path / "statement.xlsx"
+        with zipfile.ZipFile(file_path, "w") as workbook:
+            workbook.writestr("xl/workbook.xml", "<workbook/>")
+        mock_read_excel.return_value = pd.DataFrame(columns=["Completed Date"])
+        extractor = RevolutExcelTransactionExtractor()
+
+        # Act
+        extractor.can_parse(file_path)
+
+        # Assert
+        mock_read_excel.assert_called_once()
+
 
 class TestRevolutExcelExtractDates:
     """Tests for extract_dates() method."""
@@ -253,6 +360,35 @@ class TestRevolutExcelExtractTransactions:
         assert tx.currency == "EUR"
         assert tx.fee is None  # 0.0 fee is converted to None
 
+    @patch("parsers.revolut_excel_transaction_extractor.pd.read_excel")
+    def test_extracts_transactions_without_started_date_column(self, mock_read_excel):
+        """Exports without a Started Date column still yield their transactions."""
+        # Arrange
+        mock_df = create_mock_dataframe(
+            [
+                {
+                    COLUMN_TYPE: "Topup",
+                    COLUMN_PRODUCT: "Current",
+                    COLUMN_COMPLETED_DATE: datetime(2024, 5, 10, 12, 0, 5),
+                    COLUMN_DESCRIPTION: "Top-up by *1234",
+                    COLUMN_AMOUNT: 100.00,
+                    COLUMN_FEE: 0.0,
+                    COLUMN_CURRENCY: "EUR",
+                    COLUMN_STATE: "COMPLETED",
+                    COLUMN_BALANCE: 100.00,
+                },
+            ]
+        )
+        mock_read_excel.return_value = mock_df
+        extractor = RevolutExcelTransactionExtractor(product="Current")
+
+        # Act
+        result = extractor.extract_transactions(Path("statement.xlsx"))
+
+        # Assert
+        assert len(result) == 1
+        assert result[0].transaction_date == "10 May 2024"
+
     @patch("parsers.revolut_excel_transaction_extractor.pd.read_excel")
     def test_extracts_debit_transaction(self, mock_read_excel):
         """Extracts debit transaction (negative amount) correctly."""
@@ -535,6 +671,46 @@ class TestRevolutExcelExtractTransactions:
         # Assert
         assert result == []
 
+    @patch("parsers.revolut_excel_transaction_extractor.pd.read_excel")
+    def test_unchanged_file_is_read_only_once(self, mock_read_excel, tmp_path):
+        """Dates, transactions and products share one read of an unchanged file."""
+        # Arrange
+        excel_path = tmp_path / "statement.xlsx"
+        excel_path.write_bytes(b"xlsx")
+        mock_df = create_mock_dataframe(
+            [
+                {
+                    COLUMN_TYPE: "Card Payment",
+                    COLUMN_PRODUCT: "Current",
+                    COLUMN_STARTED_DATE: datetime(2024, 1, 1),
+                    COLUMN_COMPLETED_DATE: datetime(2024, 1, 2),
+                    COLUMN_DESCRIPTION: "Shop",
+                    COLUMN_AMOUNT: -10.00,
+                    COLUMN_FEE: 0.0,
+                    COLUMN_CURRENCY: "EUR",
+                    COLUMN_STATE: "COMPLETED",
+                    COLUMN_BALANCE: 90.00,
+                },
+            ]
+        )
+        mock_read_excel.return_value = mock_df
+        extractor = RevolutExcelTransactionExtractor(product="Current")
+
+        # Act
+        dates = extractor.extract_dates(excel_path)
+        transactions = extractor.extract_transactions(excel_path)
+        products = extractor.get_available_products(excel_path)
+        calls_before_change = mock_read_excel.call_count
+        excel_path.write_bytes(b"xlsx, modified")
+        extractor.extract_dates(excel_path)
+
+        # Assert
+        assert dates == ("2 Jan 2024", "2 Jan 2024")
+        assert len(transactions) == 1
+        assert products == ["Current"]
+        assert calls_before_change == 1
+        assert mock_read_excel.call_count == 2
+
 
 class TestRevolutExcelGetAvailableProducts:
     """Tests for get_available_products() method."""